@@ -1,9 +1,10 @@
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict, computed_field
 from utils.enums import CommentStatus
+from .common import ORMReadSchema
 
 
-class CommentSchema(BaseModel):
+class CommentSchema(ORMReadSchema):
     id: int
     user_name: str
     created_at: datetime
@@ -1,3 +1,4 @@
+from typing import Any, ClassVar
 from pydantic import BaseModel
 
 
@@ -5,4 +6,20 @@ class MessageResponseSchema(BaseModel):
     message: str
 
 class ImageResponseSchema(BaseModel):
-    filename: str
\ No newline at end of file
+    filename: str
+
+
+class ORMReadSchema(BaseModel):
+    """Read DTO that can be built from trusted ORM rows without re-validation."""
+
+    __orm_fields__: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.__orm_fields__ = tuple(cls.model_fields)
+
+    @classmethod
+    def from_orm_fast(cls, row: Any):
+        """Copy already-typed column values with model_construct; never use on client input."""
+        return cls.model_construct(**{field: getattr(row, field) for field in cls.__orm_fields__})
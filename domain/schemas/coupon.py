@@ -1,8 +1,16 @@
-from datetime import date, datetime
-from pydantic import BaseModel, ConfigDict, field_serializer, field_validator, Field
+from datetime import date
+from typing import Annotated
+from pydantic import BaseModel, BeforeValidator, ConfigDict, field_serializer, Field
 
+from .common import ORMReadSchema
 
-class CouponSchema(BaseModel):
+
+def _empty_to_none(v):
+    # An empty form value means "no expiry"; everything else is parsed as an ISO date by pydantic-core.
+    return None if v == "" else v
+
+
+class CouponSchema(ORMReadSchema):
     id: int
     code: str
     discount_value: int
@@ -18,17 +26,6 @@ class CouponSchema(BaseModel):
 class CouponCreateSchema(BaseModel):
     code: str | None = None
     discount_value: int = Field(gt=0, le=100)
-    expires_at: date | None
+    expires_at: Annotated[date | None, BeforeValidator(_empty_to_none)]
 
     model_config = ConfigDict(from_attributes=True)
-
-    # validator to convert string -> date
-    @field_validator("expires_at", mode="before")
-    @classmethod
-    def parse_date(cls, v):
-        if not v:
-            return None
-        try:
-            return datetime.strptime(v, "%Y-%m-%d").date()
-        except ValueError:
-            raise ValueError(f"expires_at must be in yyyy-mm-dd format, got {v}")
@@ -1,7 +1,9 @@
 from pydantic import BaseModel, RootModel, ConfigDict, field_validator
 
+from .common import ORMReadSchema
 
-class DishSchema(BaseModel):
+
+class DishSchema(ORMReadSchema):
     name: str
     description: str
     price: int
@@ -20,6 +22,12 @@ class DishSchema(BaseModel):
             return {extra.name: extra.price for extra in value}
         return value
 
+    @classmethod
+    def from_orm_fast(cls, row):
+        values = {field: getattr(row, field) for field in cls.__orm_fields__}
+        values["extras"] = {extra.name: int(extra.price) for extra in row.extras}
+        return cls.model_construct(**values)
+
 
 class CategoryNamesSchema(BaseModel):
     category_names: list[str]
@@ -1,10 +1,12 @@
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict, field_serializer
 
+from .common import ORMReadSchema
+
 from utils.enums import NotificationType
 
 
-class NotificationSchema(BaseModel):
+class NotificationSchema(ORMReadSchema):
     id: int
     title: str
     created_staff_id: int | None
@@ -44,5 +44,9 @@ class OrderResponseSchema(BaseModel):
     orders_count: int
 
 
+class AdminOverviewSchema(OrderResponseSchema):
+    unread_notif_count: int
+
+
 class OrderCountResponseSchema(BaseModel):
     count: int
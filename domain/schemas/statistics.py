@@ -1,14 +1,18 @@
 from datetime import date
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 
 
 class StatisticsQuerySchema(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
+    model_config = ConfigDict(validate_by_name=True, frozen=True)
 
     start_date: date = Field(..., alias="startDate")
     end_date: date = Field(..., alias="endDate")
 
 
+# Built once at import so query validation doesn't go through FastAPI's dependency analysis.
+STATISTICS_QUERY_ADAPTER = TypeAdapter(StatisticsQuerySchema)
+
+
 class SalesSummarySchema(BaseModel):
     dates: list[str]
     total_sales: list[float]
@@ -2,6 +2,6 @@ from .comment import get_comments, create_comment, update_comment_status
 from .coupon import create_coupon, check_coupon, get_coupons, deactivate_coupon
 from .menu import update_categories, create_or_update_dish, add_dish_like, get_dishes, get_categories, build_user_menu, build_staff_menu
 from .notification import get_notifications, mark_notification_as_read, count_unread_notifications
-from .order import get_orders, complete_order, create_order, get_orders_count
-from .statistic import get_sales_summary, get_dish_order_stats
+from .order import get_orders, iter_orders, complete_order, create_order, get_orders_count
+from .statistic import get_sales_summary, get_dish_order_stats, iter_sales_summary
 from .user import create_user, register_staff, authenticate_staff, get_user_sessions_count, get_total_amount, user_exists_for_role
\ No newline at end of file
@@ -1,5 +1,4 @@
-from datetime import datetime
-from sqlalchemy import select
+from sqlalchemy import select, func
 from sqlalchemy.orm import Session
 
 from domain.schemas import CommentSchema, CommentCreateSchema
@@ -18,7 +17,7 @@ def get_comments(db: Session, limit: int) -> list[CommentSchema]:
     )
 
     comments = db.scalars(stmt).all()
-    return [CommentSchema.model_validate(c) for c in comments]
+    return [CommentSchema.from_orm_fast(c) for c in comments]
 
 
 def create_comment(db: Session, user_id: int, data: CommentCreateSchema, notifier=notify_moderator) -> int:
@@ -43,7 +42,7 @@ def update_comment_status(db: Session, user_id: int, comment_id: int, new_status
 
     comment.status = new_status
     comment.moderator_id = user_id
-    comment.moderated_at = datetime.utcnow()
+    comment.moderated_at = func.now()
     db.flush()
 
     return comment
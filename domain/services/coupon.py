@@ -1,10 +1,10 @@
 from datetime import datetime
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy import select, or_
+from sqlalchemy import select, or_, func
 from sqlalchemy.orm import Session
 
 from domain.core.errors import NotFoundError, ConflictError, DomainValidationError
 from infrastructure.db.models.users import Coupon
+from infrastructure.db.inserts import insert_ignore
 from domain.schemas import CouponSchema, CouponCreateSchema
 from utils.coupons import generate_coupon_code
 
@@ -12,21 +12,18 @@ from utils.coupons import generate_coupon_code
 def create_coupon(db: Session, data: CouponCreateSchema) -> int:
     code = data.code or generate_coupon_code()
 
-    new_coupon = Coupon(
+    coupon_id = insert_ignore(
+        db,
+        Coupon,
+        [Coupon.code],
         code=code,
         discount_value=data.discount_value,
         is_active=True,
         expires_at=data.expires_at,
     )
-
-    try:
-        db.add(new_coupon)
-        db.flush()
-    except IntegrityError:
-        db.rollback()
+    if coupon_id is None:
         raise ConflictError(f"Купон з кодом: {code} вже існує")
-
-    return new_coupon.id
+    return coupon_id
 
 
 def get_coupons(db: Session) -> list[CouponSchema]:
@@ -39,7 +36,7 @@ def get_coupons(db: Session) -> list[CouponSchema]:
         )
     )
     coupons = db.scalars(stmt).all()
-    return [CouponSchema.model_validate(c) for c in coupons]
+    return [CouponSchema.from_orm_fast(c) for c in coupons]
 
 
 def deactivate_coupon(db: Session, coupon_id: int) -> None:
@@ -70,7 +67,7 @@ def check_coupon(db: Session, coupon_code: str, user_id: int) -> int:
         raise DomainValidationError("Купон протермінований")
 
     coupon.user_id = user_id
-    coupon.used_at = datetime.utcnow()
+    coupon.used_at = func.now()
     coupon.is_active = False
 
     return coupon.discount_value
@@ -1,8 +1,9 @@
 from sqlalchemy import select, update as sa_update
-from sqlalchemy.orm import selectinload, Session, with_loader_criteria
+from sqlalchemy.orm import raiseload, selectinload, Session, with_loader_criteria
 
-from domain.core.errors import NotFoundError
+from domain.core.errors import NotFoundError, ConflictError
 from infrastructure.db.models.users import Category, Dish, DishLike
+from infrastructure.db.inserts import insert_ignore
 from domain import schemas
 
 
@@ -63,23 +64,27 @@ def create_or_update_dish(db: Session, dish_data: schemas.DishUpdateSchema) -> N
 
 
 def add_dish_like(db: Session, user_id: int, dish_code: str) -> None:
-    dish = db.scalar(
-        select(Dish)
-        .where(Dish.code == dish_code)
-        .with_for_update()
-    )
-
-    if not dish:
+    if db.scalar(select(Dish.code).where(Dish.code == dish_code)) is None:
         raise NotFoundError("Страву не знайдено")
 
-    db.add(DishLike(user_id=user_id, dish_code=dish_code))
-    db.flush()
+    # A repeat like is a no-op insert rather than an IntegrityError, so the session stays usable.
+    inserted = insert_ignore(
+        db,
+        DishLike,
+        [DishLike.user_id, DishLike.dish_code],
+        user_id=user_id,
+        dish_code=dish_code,
+    )
+    if inserted is None:
+        raise ConflictError("Ви вже оцінювали цей продукт")
 
-    dish.likes += 1
+    # Atomic increment in SQL: no row lock needed around a read-modify-write.
+    db.execute(sa_update(Dish).where(Dish.code == dish_code).values(likes=Dish.likes + 1))
 
 
 def get_dishes(db: Session, include_unpriced: bool) -> schemas.GetDishesResponseSchema:
-    dish_query = select(Dish)
+    # Extras are the only relationship DishSchema reads; anything else would be an N+1 lazy load.
+    dish_query = select(Dish).options(selectinload(Dish.extras), raiseload("*"))
     if not include_unpriced:
         dish_query = dish_query.where(Dish.price > 0)
 
@@ -90,7 +95,7 @@ def get_dishes(db: Session, include_unpriced: bool) -> schemas.GetDishesResponse
     recommended: list[str] = []
 
     for dish in dish_list:
-        dishes[dish.code] = schemas.DishSchema.model_validate(dish)
+        dishes[dish.code] = schemas.DishSchema.from_orm_fast(dish)
         if dish.is_popular:
             popular.append(dish.code)
         if dish.is_recommended:
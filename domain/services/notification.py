@@ -1,4 +1,3 @@
-from datetime import datetime
 from sqlalchemy import select, func
 from sqlalchemy.orm import Session
 
@@ -13,10 +12,10 @@ def get_notifications(only_unread: bool, db: Session) -> list[NotificationSchema
     if only_unread:
         stmt = stmt.where(AdminNotification.is_read.is_(False))
 
-    stmt = stmt.order_by(AdminNotification.created_at.desc())
+    stmt = stmt.order_by(AdminNotification.created_at.desc(), AdminNotification.id.desc())
     notifications = db.scalars(stmt).all()
 
-    return [NotificationSchema.model_validate(n) for n in notifications]
+    return [NotificationSchema.from_orm_fast(n) for n in notifications]
 
 
 def count_unread_notifications(db: Session) -> int:
@@ -33,4 +32,4 @@ def mark_notification_as_read(db: Session, notification_id: int, user_id: int) -
     if not notification.is_read:
         notification.is_read = True
         notification.read_staff_id = user_id
-        notification.read_at = datetime.utcnow()
+        notification.read_at = func.now()
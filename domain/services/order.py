@@ -1,6 +1,6 @@
-from datetime import datetime
-from sqlalchemy import select, func
-from sqlalchemy.orm import Session
+from collections.abc import Iterator
+from sqlalchemy import insert, select, func, update
+from sqlalchemy.orm import Session, raiseload
 
 from domain.core.errors import NotFoundError, ConflictError
 from infrastructure.db.models.users import Order
@@ -8,28 +8,59 @@ from domain.schemas import OrderSchema, OrderCreateSchema, OrderOperationResultS
 from utils.orders import calculate_order_lead_time
 
 
-def get_orders(db: Session, only_uncompleted: bool = True) -> list[OrderSchema]:
-    stmt = select(Order).order_by(Order.created_at)
+ORDERS_STREAM_BATCH = 500
+
+
+def get_orders(db: Session, only_uncompleted: bool = True) -> tuple[list[OrderSchema], int]:
+    # OrderSchema reads only columns; raiseload keeps a future field from lazy-loading user/staff per row.
+    stmt = (
+        select(Order, func.count().over().label("total"))
+        .options(raiseload("*"))
+        .order_by(Order.created_at, Order.id)
+    )
     if only_uncompleted:
         stmt = stmt.where(Order.completed_by.is_(None))
 
-    orders = db.scalars(stmt).all()
+    rows = db.execute(stmt).all()
+    total = rows[0].total if rows else 0
+
+    return [OrderSchema.model_validate(row.Order) for row in rows], total
+
+
+def iter_orders(db: Session, only_uncompleted: bool = True) -> Iterator[OrderSchema]:
+    """Yield orders oldest first, fetched in batches over a server-side cursor."""
+    stmt = (
+        select(Order)
+        .options(raiseload("*"))
+        .order_by(Order.created_at, Order.id)
+        .execution_options(yield_per=ORDERS_STREAM_BATCH)
+    )
+    if only_uncompleted:
+        stmt = stmt.where(Order.completed_by.is_(None))
 
-    return [OrderSchema.model_validate(order) for order in orders]
+    for order in db.scalars(stmt):
+        yield OrderSchema.model_validate(order)
 
 
 def complete_order(db: Session, order_id: int, employee_id: int) -> None:
-    order = db.get(Order, order_id)
-    if not order:
-        raise NotFoundError("Замовлення не знайдено")
-    if order.completed_by is not None:
-        raise ConflictError("Замовлення вже виконано")
+    # Single conditional UPDATE: concurrent completions can't both succeed and no row lock is held.
+    stmt = (
+        update(Order)
+        .where(Order.id == order_id, Order.completed_by.is_(None))
+        .values(completed_by=employee_id, completed_at=func.now())
+    )
+    if db.execute(stmt).rowcount:
+        return
 
-    order.completed_by = employee_id
-    order.completed_at = datetime.utcnow()
+    if db.get(Order, order_id) is None:
+        raise NotFoundError("Замовлення не знайдено")
+    raise ConflictError("Замовлення вже виконано")
 
-def get_orders_count(db: Session) -> int:
-    return db.scalar(select(func.count()).select_from(Order)) or 0
+def get_orders_count(db: Session, only_uncompleted: bool = False) -> int:
+    stmt = select(func.count()).select_from(Order)
+    if only_uncompleted:
+        stmt = stmt.where(Order.completed_by.is_(None))
+    return db.scalar(stmt) or 0
 
 
 def create_order(
@@ -42,7 +73,8 @@ def create_order(
         for k, v in order_data.order_details.items()
     }
 
-    new_order = Order(
+    # Core INSERT: one statement, the id comes back via RETURNING/lastrowid, no ORM state to track.
+    stmt = insert(Order).values(
         user_id=user_id,
         table=order_data.table,
         original_cost=order_data.original_cost,
@@ -51,14 +83,13 @@ def create_order(
         final_cost=order_data.final_cost,
         order_details=order_details_dict,
     )
-    db.add(new_order)
-    db.flush()
+    order_id = db.execute(stmt).inserted_primary_key[0]
 
     lead_time = calculate_order_lead_time(order_details_dict.keys())
 
     return OrderOperationResultSchema(
         message="Замовлення прийнято",
-        id=new_order.id,
+        id=order_id,
         leadTime=lead_time
     )
 
@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from datetime import date
 from sqlalchemy import select
 from sqlalchemy.orm import Session
@@ -6,51 +7,67 @@ from infrastructure.db.models.admin import SalesSummary, DishOrdersStats
 from domain.schemas import SalesSummarySchema, DishOrderStatsSchema
 
 
+SALES_STREAM_BATCH = 500
+
+
+def _avg_check_size(row) -> float:
+    return round(row.total_sales / row.orders, 2) if row.orders > 0 else 0.0
+
+
 def get_sales_summary(
         db: Session,
         start_date: date,
         end_date: date,
 ) -> SalesSummarySchema:
     stmt = (
-        select(SalesSummary)
+        select(
+            SalesSummary.date,
+            SalesSummary.total_sales,
+            SalesSummary.orders,
+            SalesSummary.returning_customers,
+        )
         .where(SalesSummary.date.between(start_date, end_date))
         .order_by(SalesSummary.date)
     )
+    rows = db.execute(stmt).all()
 
-    results = db.scalars(stmt).all()
-
-    dates: list[str] = []
-    total_sales: list[float] = []
-    orders: list[int] = []
-    returning_customers: list[int] = []
-    avg_check_sizes: list[float] = []
-
-    for row in results:
-        dates.append(row.date.strftime("%d-%m"))
-        total_sales.append(row.total_sales)
-        orders.append(row.orders)
-        returning_customers.append(row.returning_customers)
+    # One row per day (date is unique), so plain column tuples need no grouping or ORM identity map.
+    return SalesSummarySchema.model_construct(
+        dates=[row.date.strftime("%d-%m") for row in rows],
+        total_sales=[row.total_sales for row in rows],
+        orders=[row.orders for row in rows],
+        returning_customers=[row.returning_customers for row in rows],
+        avg_check_sizes=[_avg_check_size(row) for row in rows],
+    )
 
-        avg_check_sizes.append(
-            round(row.total_sales / row.orders, 2)
-            if row.orders > 0
-            else 0.0
-        )
 
-    return SalesSummarySchema(
-        dates=dates,
-        total_sales=total_sales,
-        orders=orders,
-        returning_customers=returning_customers,
-        avg_check_sizes=avg_check_sizes,
+def iter_sales_summary(db: Session, start_date: date, end_date: date) -> Iterator[dict]:
+    """Yield one sales summary row per day, fetched in batches over a server-side cursor."""
+    stmt = (
+        select(SalesSummary)
+        .where(SalesSummary.date.between(start_date, end_date))
+        .order_by(SalesSummary.date)
+        .execution_options(yield_per=SALES_STREAM_BATCH)
     )
 
+    for row in db.scalars(stmt):
+        yield {
+            "date": row.date.strftime("%d-%m"),
+            "total_sales": row.total_sales,
+            "avg_check_size": _avg_check_size(row),
+            "orders": row.orders,
+            "returning_customers": row.returning_customers,
+        }
 
-def get_dish_order_stats(db: Session, limit: int = 10) -> DishOrderStatsSchema:
-    stmt = select(DishOrdersStats).order_by(DishOrdersStats.orders.desc()).limit(limit)
-    results = db.scalars(stmt).all()
 
-    return DishOrderStatsSchema(
-        dishes=[row.code for row in results],
-        orders=[row.orders for row in results]
+def get_dish_order_stats(db: Session, limit: int = 10) -> DishOrderStatsSchema:
+    stmt = (
+        select(DishOrdersStats.code, DishOrdersStats.orders)
+        .order_by(DishOrdersStats.orders.desc(), DishOrdersStats.id)
+        .limit(limit)
     )
+    rows = db.execute(stmt).all()
+    dishes, orders = (list(column) for column in zip(*rows)) if rows else ([], [])
+
+    # Plain column values straight from the table, so construct without re-validation.
+    return DishOrderStatsSchema.model_construct(dishes=dishes, orders=orders)
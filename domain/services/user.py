@@ -1,23 +1,28 @@
-from sqlalchemy import select, func
+from sqlalchemy import exists, insert, select, func
 from sqlalchemy.orm import Session
 
+from domain.core.errors import ConflictError
 from domain.schemas import RegisterRequestSchema, LoginRequestSchema
 from domain.core.security import hash_password, verify_password
 from infrastructure.db.models.admin import Staff
 from infrastructure.db.models.users import User, Order
+from infrastructure.db.inserts import insert_ignore
 from infrastructure.db.role_maps import ROLE_MODEL_MAP
 from utils.enums import UserRole
 
 
 def register_staff(db: Session, data: RegisterRequestSchema) -> int:
-    user = Staff(
+    user_id = insert_ignore(
+        db,
+        Staff,
+        [Staff.email],
         name=data.username,
         email=data.email,
-        password=hash_password(data.password)
+        password_hash=hash_password(data.password),
     )
-    db.add(user)
-    db.flush()
-    return user.id
+    if user_id is None:
+        raise ConflictError(f"Email {data.email} вже використана")
+    return user_id
 
 
 def authenticate_staff(db: Session, data: LoginRequestSchema) -> Staff | None:
@@ -33,16 +38,16 @@ def get_user_sessions_count(db: Session, user_id: int) -> int:
 
 
 def create_user(db: Session) -> int:
-    user = User()
-    db.add(user)
-    db.flush()
-    return user.id
+    return db.execute(insert(User)).inserted_primary_key[0]
 
 
-def get_total_amount(db: Session, user_id: int) -> int:
+def get_total_amount(db: Session, user_id: int) -> float:
     stmt = select(func.sum(Order.final_cost)).filter_by(user_id=user_id)
-    return db.scalar(stmt) or 0
+    # SQLite sums integral costs as int; normalise so the annotation holds on every backend.
+    return float(db.scalar(stmt) or 0)
 
 
 def user_exists_for_role(db: Session, user_id: int, role: UserRole) -> bool:
-    return db.get(ROLE_MODEL_MAP[role], user_id) is not None
+    # EXISTS on the primary key: no columns fetched and no entity added to the identity map.
+    model = ROLE_MODEL_MAP[role]
+    return db.scalar(select(exists().where(model.id == user_id)))
@@ -1,54 +1,85 @@
 from fastapi import APIRouter, Depends, status, HTTPException, Response, Query, UploadFile, File, Request, \
     BackgroundTasks
+from fastapi.responses import StreamingResponse
 from fastapi_cache import FastAPICache
+from fastapi_cache.decorator import cache
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
+import anyio
 import logging
+import orjson
+import os
 
 from domain.core.constants import CacheNamespace
 from domain.core.errors import NotFoundError, ConflictError, DomainError
 from fastapi_app.dependencies.db import get_db
+from fastapi_app.dependencies.validation import json_body, openapi_body, query_model, openapi_query
 from fastapi_app.core.limiter import limiter
+from fastapi_app.core.responses import trusted_response
 from domain import services
 from fastapi_app.auth.jwt import create_access_token
-from fastapi_app.dependencies.auth import require_min_role, require_valid_user
+from fastapi_app.dependencies.auth import require_staff, require_moderator, require_valid_staff, \
+    invalidate_cached_user
 from fastapi_app.auth.cookies import set_auth_cookie, clear_auth_cookie
 from domain import schemas
+from domain.schemas.statistics import STATISTICS_QUERY_ADAPTER
 from utils.enums import UserRole
+from utils.helpers import date_range_key
 from utils.images import process_image_upload
 
 logger = logging.getLogger(__name__)
 
+# Pillow work runs on its own limiter so uploads can't occupy the shared threadpool.
+IMAGE_LIMITER = anyio.CapacityLimiter(os.cpu_count() or 1)
+# Same for bcrypt: a login flood waits here instead of draining the threadpool other sync routes use.
+PASSWORD_LIMITER = anyio.CapacityLimiter(os.cpu_count() or 1)
+
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
+async def _clear_cache(namespace: str) -> None:
+    # Runs after the response is sent; a failed clear only leaves entries until they expire.
+    try:
+        await FastAPICache.clear(namespace)
+    except Exception:
+        logger.exception("Cache_clear_failed namespace=%s", namespace)
+
+
 @router.get("/me", response_model=schemas.CurrentUserSchema)
-def get_me(
-        current_user: schemas.CurrentUserSchema = Depends(require_valid_user(UserRole.staff)),
+async def get_me(
+        current_user: schemas.CurrentUserSchema = Depends(require_valid_staff),
 ):
-    return current_user
+    return trusted_response(current_user)
 
 
-@router.post('/auth/register', status_code=status.HTTP_201_CREATED, response_model=schemas.UserResponseSchema)
+@router.post(
+    '/auth/register',
+    status_code=status.HTTP_201_CREATED,
+    response_model=schemas.UserResponseSchema,
+    openapi_extra=openapi_body(schemas.RegisterRequestSchema),
+)
 @limiter.limit("10/hour")
-def register_endpoint(
+async def register_endpoint(
         request: Request,
-        auth_data: schemas.RegisterRequestSchema,
         response: Response,
+        auth_data: schemas.RegisterRequestSchema = Depends(json_body(schemas.RegisterRequestSchema)),
         db: Session = Depends(get_db),
 ):
     try:
-        user_id = services.register_staff(db, auth_data)
-        db.commit()
-        logger.info(f"registered_user user={user_id} email={auth_data.email}")
-    except IntegrityError:
-        db.rollback()
+        user_id = await anyio.to_thread.run_sync(
+            services.register_staff, db, auth_data, limiter=PASSWORD_LIMITER
+        )
+        await run_in_threadpool(db.commit)
+        logger.info("registered_user user=%s email=%s", user_id, auth_data.email)
+    except ConflictError as e:
+        await run_in_threadpool(db.rollback)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail=f"Email {auth_data.email} вже використана"
+            detail=str(e),
         )
     except SQLAlchemyError:
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         logger.exception("Failed_to_register_user")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -61,15 +92,21 @@ def register_endpoint(
     return {"user_id": user_id}
 
 
-@router.post("/auth/login", response_model=schemas.UserResponseSchema)
+@router.post(
+    "/auth/login",
+    response_model=schemas.UserResponseSchema,
+    openapi_extra=openapi_body(schemas.LoginRequestSchema),
+)
 @limiter.limit("5/hour")
-def login_endpoint(
+async def login_endpoint(
         request: Request,
-        auth_data: schemas.LoginRequestSchema,
         response: Response,
+        auth_data: schemas.LoginRequestSchema = Depends(json_body(schemas.LoginRequestSchema)),
         db: Session = Depends(get_db),
 ):
-    user = services.authenticate_staff(db, auth_data)
+    user = await anyio.to_thread.run_sync(
+        services.authenticate_staff, db, auth_data, limiter=PASSWORD_LIMITER
+    )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -87,24 +124,29 @@ def login_endpoint(
 
 
 @router.post('/auth/logout', response_model=schemas.MessageResponseSchema)
-def logout_endpoint(response: Response):
+async def logout_endpoint(request: Request, response: Response):
+    await invalidate_cached_user(request)
     clear_auth_cookie(response)
     return {"message": "Ви вийшли з системи"}
 
 
 @router.get('/menu', response_model=schemas.StaffMenuResponseSchema)
 def get_menu_endpoint(
-        _: schemas.CurrentUserSchema = Depends(require_min_role(UserRole.staff)),
+        _: schemas.CurrentUserSchema = Depends(require_staff),
         db: Session = Depends(get_db),
 ):
-    return services.build_staff_menu(db)
+    return trusted_response(services.build_staff_menu(db))
 
 
-@router.patch('/categories', response_model=schemas.MessageResponseSchema)
+@router.patch(
+    '/categories',
+    response_model=schemas.MessageResponseSchema,
+    openapi_extra=openapi_body(schemas.CategoryNamesSchema),
+)
 def update_categories_endpoint(
-        data: schemas.CategoryNamesSchema,
         background_tasks: BackgroundTasks,
-        _: schemas.CurrentUserSchema = Depends(require_min_role(UserRole.staff)),
+        _: schemas.CurrentUserSchema = Depends(require_staff),
+        data: schemas.CategoryNamesSchema = Depends(json_body(schemas.CategoryNamesSchema)),
         db: Session = Depends(get_db),
 ):
     try:
@@ -116,16 +158,20 @@ def update_categories_endpoint(
         logger.exception("Failed_to_update_categories")
         raise
 
-    background_tasks.add_task(FastAPICache.clear, CacheNamespace.MENU)
+    background_tasks.add_task(_clear_cache, CacheNamespace.MENU)
 
     return {"message": "Категорії оновлено"}
 
 
-@router.post('/dishes', response_model=schemas.MessageResponseSchema)
+@router.post(
+    '/dishes',
+    response_model=schemas.MessageResponseSchema,
+    openapi_extra=openapi_body(schemas.DishUpdateSchema),
+)
 def create_or_update_dish_endpoint(
-        data: schemas.DishUpdateSchema,
         background_tasks: BackgroundTasks,
-        _: schemas.CurrentUserSchema = Depends(require_min_role(UserRole.staff)),
+        _: schemas.CurrentUserSchema = Depends(require_staff),
+        data: schemas.DishUpdateSchema = Depends(json_body(schemas.DishUpdateSchema)),
         db: Session = Depends(get_db),
 ):
     try:
@@ -137,7 +183,7 @@ def create_or_update_dish_endpoint(
         logger.exception("Failed_to_update_dish")
         raise
 
-    background_tasks.add_task(FastAPICache.clear, CacheNamespace.MENU)
+    background_tasks.add_task(_clear_cache, CacheNamespace.MENU)
 
     return {"message": f"Страву {data.code} оновлено"}
 
@@ -145,22 +191,22 @@ def create_or_update_dish_endpoint(
 @router.get('/notifications', response_model=list[schemas.NotificationSchema])
 def get_notifications_endpoint(
         only_unread: bool = Query(False),
-        _: schemas.CurrentUserSchema = Depends(require_min_role(UserRole.staff)),
+        _: schemas.CurrentUserSchema = Depends(require_staff),
         db: Session = Depends(get_db)
 ):
-    return services.get_notifications(only_unread, db)
+    return trusted_response(services.get_notifications(only_unread, db))
 
 
 @router.patch('/notifications/{notification_id}', response_model=schemas.MessageResponseSchema)
 def mark_notification_as_read_endpoint(
         notification_id: int,
-        current_user: schemas.CurrentUserSchema = Depends(require_min_role(UserRole.staff)),
+        current_user: schemas.CurrentUserSchema = Depends(require_staff),
         db: Session = Depends(get_db)
 ):
     try:
         services.mark_notification_as_read(db, notification_id, current_user.id)
         db.commit()
-        logger.info(f"notification_marked_read notification_id={notification_id} user_id={current_user.id}")
+        logger.info("notification_marked_read notification_id=%s user_id=%s", notification_id, current_user.id)
     except NotFoundError as e:
         db.rollback()
         raise HTTPException(
@@ -169,7 +215,7 @@ def mark_notification_as_read_endpoint(
         )
     except Exception:
         db.rollback()
-        logger.exception(f"Failed_to_mark_notification id={notification_id}")
+        logger.exception("Failed_to_mark_notification id=%s", notification_id)
         raise
 
     return {"message": f"Сповіщення:{notification_id} помічене як прочитане"}
@@ -177,17 +223,22 @@ def mark_notification_as_read_endpoint(
 
 @router.get("/notifications/unread/count", response_model=schemas.NotificationCountResponseSchema)
 def get_unread_notification_count_endpoint(
-        _: schemas.CurrentUserSchema = Depends(require_min_role(UserRole.staff)),
+        _: schemas.CurrentUserSchema = Depends(require_staff),
         db: Session = Depends(get_db),
 ):
     unread_notifications_count = services.count_unread_notifications(db)
-    return {"unread_notif_count": unread_notifications_count}
+    return trusted_response({"unread_notif_count": unread_notifications_count})
 
 
-@router.get('/statistics', response_model=schemas.StatisticsResponseSchema)
+@router.get(
+    '/statistics',
+    response_model=schemas.StatisticsResponseSchema,
+    openapi_extra=openapi_query(schemas.StatisticsQuerySchema),
+)
+@cache(expire=300, namespace=CacheNamespace.STATISTICS, key_builder=date_range_key())
 def statistics_endpoint(
-        params: schemas.StatisticsQuerySchema = Depends(),
-        _: schemas.CurrentUserSchema = Depends(require_min_role(UserRole.staff)),
+        params: schemas.StatisticsQuerySchema = Depends(query_model(STATISTICS_QUERY_ADAPTER)),
+        _: schemas.CurrentUserSchema = Depends(require_staff),
         db: Session = Depends(get_db)
 ):
     if params.start_date > params.end_date:
@@ -197,27 +248,62 @@ def statistics_endpoint(
         )
     sales_summary = services.get_sales_summary(db, params.start_date, params.end_date)
     dish_order_stats = services.get_dish_order_stats(db)
-    return {"sales_summary": sales_summary, "dish_order_stats": dish_order_stats}
+
+    # fastapi-cache encodes the return value itself, so hand it the model rather than a Response
+    return schemas.StatisticsResponseSchema.model_construct(
+        sales_summary=sales_summary,
+        dish_order_stats=dish_order_stats,
+    )
+
+
+@router.get(
+    '/statistics/stream',
+    response_class=StreamingResponse,
+    responses={status.HTTP_200_OK: {"content": {"application/x-ndjson": {}}}},
+    openapi_extra=openapi_query(schemas.StatisticsQuerySchema),
+)
+def statistics_stream_endpoint(
+        params: schemas.StatisticsQuerySchema = Depends(query_model(STATISTICS_QUERY_ADAPTER)),
+        _: schemas.CurrentUserSchema = Depends(require_staff),
+        db: Session = Depends(get_db)
+):
+    if params.start_date > params.end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_date must be before or equal to end_date"
+        )
+    rows = services.iter_sales_summary(db, params.start_date, params.end_date)
+
+    # The session dependency is closed only after the body has been sent.
+    return StreamingResponse(
+        (orjson.dumps(row) + b"\n" for row in rows),
+        media_type="application/x-ndjson",
+    )
 
 
 @router.get('/coupons', response_model=list[schemas.CouponSchema])
 def get_coupons_endpoint(
-        _: schemas.CurrentUserSchema = Depends(require_min_role(UserRole.staff)),
+        _: schemas.CurrentUserSchema = Depends(require_staff),
         db: Session = Depends(get_db)
 ):
-    return services.get_coupons(db)
+    return trusted_response(services.get_coupons(db))
 
 
-@router.post('/coupons', status_code=status.HTTP_201_CREATED, response_model=schemas.MessageResponseSchema)
+@router.post(
+    '/coupons',
+    status_code=status.HTTP_201_CREATED,
+    response_model=schemas.MessageResponseSchema,
+    openapi_extra=openapi_body(schemas.CouponCreateSchema),
+)
 def create_coupon_endpoint(
-        coupon_data: schemas.CouponCreateSchema,
-        _: schemas.CurrentUserSchema = Depends(require_min_role(UserRole.staff)),
+        _: schemas.CurrentUserSchema = Depends(require_staff),
+        coupon_data: schemas.CouponCreateSchema = Depends(json_body(schemas.CouponCreateSchema)),
         db: Session = Depends(get_db)
 ):
     try:
         coupon_id = services.create_coupon(db, coupon_data)
         db.commit()
-        logger.info(f"Coupon_added id={coupon_id}")
+        logger.info("Coupon_added id=%s", coupon_id)
 
     except ConflictError as e:
         db.rollback()
@@ -227,7 +313,7 @@ def create_coupon_endpoint(
         )
     except Exception:
         db.rollback()
-        logger.exception(f"Failed_to_create_coupon")
+        logger.exception("Failed_to_create_coupon")
         raise
 
     return {"message": f'Додано купон id:{coupon_id}'}
@@ -236,13 +322,13 @@ def create_coupon_endpoint(
 @router.patch("/coupons/{coupon_id}/deactivate", response_model=schemas.MessageResponseSchema)
 def deactivate_coupon_endpoint(
         coupon_id: int,
-        _: schemas.CurrentUserSchema = Depends(require_min_role(UserRole.staff)),
+        _: schemas.CurrentUserSchema = Depends(require_staff),
         db: Session = Depends(get_db),
 ):
     try:
         services.deactivate_coupon(db, coupon_id)
         db.commit()
-        logger.info(f"Coupon_deactivated id={coupon_id}")
+        logger.info("Coupon_deactivated id=%s", coupon_id)
     except NotFoundError as e:
         db.rollback()
         raise HTTPException(
@@ -257,7 +343,7 @@ def deactivate_coupon_endpoint(
         )
     except Exception:
         db.rollback()
-        logger.exception(f"Failed_to_deactivate_coupon id={coupon_id}")
+        logger.exception("Failed_to_deactivate_coupon id=%s", coupon_id)
         raise
 
     return {"message": f"Купон id:{coupon_id} деактивовано"}
@@ -266,24 +352,44 @@ def deactivate_coupon_endpoint(
 @router.get('/orders', response_model=schemas.OrderResponseSchema)
 def get_orders_endpoint(
         only_uncompleted: bool = Query(True),
-        _: schemas.CurrentUserSchema = Depends(require_min_role(UserRole.staff)),
+        _: schemas.CurrentUserSchema = Depends(require_staff),
+        db: Session = Depends(get_db),
+):
+    orders, total = services.get_orders(db, only_uncompleted)
+
+    return trusted_response(
+        schemas.OrderResponseSchema.model_construct(orders=orders, orders_count=total)
+    )
+
+
+@router.get('/overview', response_model=schemas.AdminOverviewSchema)
+def get_overview_endpoint(
+        _: schemas.CurrentUserSchema = Depends(require_staff),
         db: Session = Depends(get_db),
 ):
-    orders = services.get_orders(db, only_uncompleted)
+    orders, total = services.get_orders(db, only_uncompleted=True)
+    unread_notifications_count = services.count_unread_notifications(db)
 
-    return {"orders": orders, "orders_count": len(orders)}
+    return trusted_response(
+        schemas.AdminOverviewSchema.model_construct(
+            orders=orders,
+            orders_count=total,
+            unread_notif_count=unread_notifications_count,
+        )
+    )
 
 
 @router.get('/orders/count', response_model=schemas.OrderCountResponseSchema)
 def get_orders_count_endpoint(db: Session = Depends(get_db)):
     count = services.get_orders_count(db)
-    return {"count": count}
+    return trusted_response({"count": count})
 
 
 @router.patch('/orders/{order_id}/complete', response_model=schemas.MessageResponseSchema)
 def complete_order_endpoint(
         order_id: int,
-        current_user: schemas.CurrentUserSchema = Depends(require_min_role(UserRole.staff)),
+        background_tasks: BackgroundTasks,
+        current_user: schemas.CurrentUserSchema = Depends(require_staff),
         db: Session = Depends(get_db),
 ):
     try:
@@ -303,19 +409,23 @@ def complete_order_endpoint(
         )
     except Exception:
         db.rollback()
-        logger.exception(f"Failed_to_complete_order id={order_id}")
+        logger.exception("Failed_to_complete_order id=%s", order_id)
         raise
 
+    background_tasks.add_task(_clear_cache, CacheNamespace.STATISTICS)
+
     return {"message": f"Замовлення:{order_id} виконано."}
 
 
 @router.post("/images", status_code=status.HTTP_201_CREATED, response_model=schemas.ImageResponseSchema)
-def upload_image(
+async def upload_image(
         image: UploadFile = File(...),
-        current_user: schemas.CurrentUserSchema = Depends(require_min_role(UserRole.staff)),
+        current_user: schemas.CurrentUserSchema = Depends(require_staff),
 ):
     try:
-        filename = process_image_upload(image, current_user.id)
+        filename = await anyio.to_thread.run_sync(
+            process_image_upload, image, current_user.id, limiter=IMAGE_LIMITER
+        )
 
     except NotFoundError as e:
         raise HTTPException(
@@ -332,12 +442,16 @@ def upload_image(
     return {"filename": filename}
 
 
-@router.patch('/comments/{comment_id}', response_model=schemas.MessageResponseSchema)
+@router.patch(
+    '/comments/{comment_id}',
+    response_model=schemas.MessageResponseSchema,
+    openapi_extra=openapi_body(schemas.CommentStatusUpdate),
+)
 def update_comment_status_endpoint(
         comment_id: int,
-        data: schemas.CommentStatusUpdate,
         background_tasks: BackgroundTasks,
-        current_user: schemas.CurrentUserSchema = Depends(require_min_role(UserRole.moderator)),
+        current_user: schemas.CurrentUserSchema = Depends(require_moderator),
+        data: schemas.CommentStatusUpdate = Depends(json_body(schemas.CommentStatusUpdate)),
         db: Session = Depends(get_db),
 ):
     new_status = data.status
@@ -350,9 +464,9 @@ def update_comment_status_endpoint(
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception:
         db.rollback()
-        logger.exception(f"Failed_to_update_comment id={comment_id}")
+        logger.exception("Failed_to_update_comment id=%s", comment_id)
         raise
 
-    background_tasks.add_task(FastAPICache.clear, CacheNamespace.COMMENTS)
+    background_tasks.add_task(_clear_cache, CacheNamespace.COMMENTS)
 
     return {"message": f"Коментар {comment_id} змінив статус на {new_status.value}"}
@@ -2,14 +2,16 @@ import logging
 from fastapi import APIRouter, Depends, status, Request, HTTPException, Response
 from fastapi_cache.decorator import cache
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.exc import SQLAlchemyError
 
 from domain.core.errors import NotFoundError, ConflictError, DomainValidationError
 from domain.core.constants import RedisPrefix, CacheNamespace, CacheKey
 from fastapi_app.core.limiter import limiter
 from fastapi_app.dependencies.db import get_db
+from fastapi_app.core.responses import trusted_response
+from fastapi_app.dependencies.validation import json_body, openapi_body
 from domain import services
-from fastapi_app.dependencies.auth import get_current_user, require_valid_user
+from fastapi_app.dependencies.auth import get_current_user, require_valid_client
 from fastapi_app.auth.jwt import create_access_token
 from fastapi_app.auth.cookies import set_auth_cookie
 from domain import schemas
@@ -21,12 +23,15 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+COMMENTS_CACHE_KEY = f"{RedisPrefix.CACHE}:{CacheNamespace.COMMENTS}:{CacheKey.LIST}"
+MENU_CACHE_KEY = f"{RedisPrefix.CACHE}:{CacheNamespace.MENU}:{CacheKey.DETAIL}"
+
 
 @router.get("/me", response_model=schemas.CurrentUserSchema)
-def get_me(
-        current_user: schemas.CurrentUserSchema = Depends(require_valid_user(UserRole.client)),
+async def get_me(
+        current_user: schemas.CurrentUserSchema = Depends(require_valid_client),
 ):
-    return current_user
+    return trusted_response(current_user)
 
 
 @router.post(
@@ -64,7 +69,7 @@ def create_user_endpoint(
 @router.get("/comments", response_model=schemas.CommentResponseSchema)
 @cache(
     expire=3600,
-    key_builder=static_key(f"{RedisPrefix.CACHE}:{CacheNamespace.COMMENTS}:{CacheKey.LIST}")
+    key_builder=static_key(COMMENTS_CACHE_KEY)
 )
 def get_comments_endpoint(db: Session = Depends(get_db)):
     comments = services.get_comments(db, limit=10)
@@ -78,12 +83,13 @@ def get_comments_endpoint(db: Session = Depends(get_db)):
     responses={
         status.HTTP_429_TOO_MANY_REQUESTS: {"model": schemas.RateLimitErrorSchema}
     },
+    openapi_extra=openapi_body(schemas.CommentCreateSchema),
 )
 @limiter.limit("2/hour")
 def create_comment_endpoint(
         request: Request,
-        comment_data: schemas.CommentCreateSchema,
         current_user: schemas.CurrentUserSchema = Depends(get_current_user),
+        comment_data: schemas.CommentCreateSchema = Depends(json_body(schemas.CommentCreateSchema)),
         db: Session = Depends(get_db),
 ):
     try:
@@ -104,7 +110,7 @@ def create_comment_endpoint(
 @router.get("/menu", response_model=schemas.UserMenuResponseSchema)
 @cache(
     expire=3600,
-    key_builder=static_key(f"{RedisPrefix.CACHE}:{CacheNamespace.MENU}:{CacheKey.DETAIL}")
+    key_builder=static_key(MENU_CACHE_KEY)
 )
 def get_user_menu(db: Session = Depends(get_db)):
     return services.build_user_menu(db)
@@ -117,13 +123,18 @@ def get_discount_endpoint(
 ):
     user_total_amount = services.get_total_amount(db, current_user.id)
     discount = calculate_discount(user_total_amount)
-    return {"discount": discount}
+    return trusted_response({"discount": discount})
 
 
-@router.post("/order", response_model=schemas.OrderOperationResultSchema, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/order",
+    response_model=schemas.OrderOperationResultSchema,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=openapi_body(schemas.OrderCreateSchema),
+)
 def place_order_endpoint(
-        order_data: schemas.OrderCreateSchema,
         current_user: schemas.CurrentUserSchema = Depends(get_current_user),
+        order_data: schemas.OrderCreateSchema = Depends(json_body(schemas.OrderCreateSchema)),
         db: Session = Depends(get_db)
 ):
     try:
@@ -149,19 +160,17 @@ def like_dish_endpoint(
     try:
         services.add_dish_like(db, current_user.id, dish_code)
         db.commit()
-        logger.info(f"User_liked_dish user={current_user.id} dish={dish_code}")
+        logger.info("User_liked_dish user=%s dish=%s", current_user.id, dish_code)
     except NotFoundError as e:
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
         )
-    except IntegrityError:
-        # duplicate like or constraint violation
-        db.rollback()
+    except ConflictError as e:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail="Ви вже оцінювали цей продукт",
+            detail=str(e),
         )
 
     return {"message": "Вподобання додано"}
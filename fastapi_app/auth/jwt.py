@@ -40,7 +40,7 @@ def decode_access_token(token: str) -> TokenPayload:
             algorithms=[config.ALGORITHM],
         )
     except ExpiredSignatureError:
-        logger.info(f"Token_expired token={token}")
+        logger.info("Token_expired token=%s", token)
         raise DomainValidationError("Token expired")
 
     except JWTError:
@@ -1,31 +1,25 @@
-import logging
+import hashlib
+from fastapi import Request
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-from infrastructure.redis import get_sync_redis_client
 from domain.core.constants import RedisPrefix
 from domain.core.settings import settings
 
-logger = logging.getLogger(__name__)
 
+def hashed_remote_address(request: Request) -> str:
+    # Fixed 16-char key regardless of address length (IPv6 included).
+    return hashlib.blake2b(get_remote_address(request).encode(), digest_size=8).hexdigest()
 
-def create_limiter() -> Limiter:
-    sync_redis = get_sync_redis_client()
 
-    if sync_redis:
-        limiter = Limiter(
-            key_func=get_remote_address,
-            storage_uri=settings.REDIS_URL,
-            key_prefix=RedisPrefix.RATELIMIT
-        )
-        logger.info("Limiter_using_Redis_storage")
-    else:
-        limiter = Limiter(
-            key_func=get_remote_address,
-            key_prefix=RedisPrefix.RATELIMIT
-        )
-        logger.warning("Limiter_using_in-memory_storage")
-    return limiter
+def create_limiter() -> Limiter:
+    # No startup probe: storage connects on first hit and falls back to memory while Redis is down.
+    return Limiter(
+        key_func=hashed_remote_address,
+        storage_uri=settings.REDIS_URL,
+        key_prefix=RedisPrefix.RATELIMIT,
+        in_memory_fallback_enabled=True,
+    )
 
 
 limiter = create_limiter()
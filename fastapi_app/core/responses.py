@@ -0,0 +1,19 @@
+from typing import Any
+from fastapi import Response, status
+from pydantic import TypeAdapter
+
+_json_adapter = TypeAdapter(Any)
+
+
+def trusted_response(content: Any, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Serialize service-layer schemas straight to JSON, skipping response_model re-validation.
+
+    Use only for data the domain services built from DB rows, never for client input.
+    The route's response_model is still used for the OpenAPI docs.
+    """
+    return Response(
+        content=_json_adapter.dump_json(content),
+        status_code=status_code,
+        media_type="application/json",
+    )
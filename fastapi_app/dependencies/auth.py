@@ -1,4 +1,9 @@
+import hashlib
+import logging
+import orjson
 from fastapi import Depends, Request, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from redis.exceptions import RedisError
 from sqlalchemy.orm import Session
 
 from utils.enums import UserRole
@@ -7,11 +12,32 @@ from fastapi_app.dependencies.db import get_db
 from domain.schemas import CurrentUserSchema
 from domain.core.errors import NotFoundError, DomainValidationError, NOT_AUTHENTICATED, INSUFFICIENT_ROLE, \
     USER_NOT_FOUND
-from domain.core.constants import ROLE_ORDER
+from domain.core.constants import ROLE_ORDER, RedisPrefix
 from domain.services.user import user_exists_for_role
 
+logger = logging.getLogger(__name__)
 
-def get_current_user(request: Request) -> CurrentUserSchema:
+AUTH_CACHE_TTL = 30  # seconds a verified token skips the user lookup
+
+
+def _auth_cache_key(token: str) -> str:
+    digest = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+    return f"{RedisPrefix.CACHE}:auth:{digest}"
+
+
+async def invalidate_cached_user(request: Request) -> None:
+    redis = getattr(request.app.state, "redis", None)
+    token = request.cookies.get("access_token")
+    if not redis or not token:
+        return
+
+    try:
+        await redis.delete(_auth_cache_key(token))
+    except RedisError:
+        logger.warning("Auth_cache_invalidation_failed")
+
+
+async def get_current_user(request: Request) -> CurrentUserSchema:
     token = request.cookies.get("access_token")
 
     if not token:
@@ -35,10 +61,12 @@ def get_current_user(request: Request) -> CurrentUserSchema:
 
 
 def require_min_role(min_role: UserRole):
-    def dependency(
+    min_level = ROLE_ORDER[min_role]
+
+    async def dependency(
             current_user: CurrentUserSchema = Depends(get_current_user),
     ) -> CurrentUserSchema:
-        if ROLE_ORDER[current_user.role] < ROLE_ORDER[min_role]:
+        if ROLE_ORDER[current_user.role] < min_level:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=INSUFFICIENT_ROLE,
@@ -49,15 +77,41 @@ def require_min_role(min_role: UserRole):
 
 
 def require_valid_user(role: UserRole):
-    def dependency(
+    async def dependency(
+            request: Request,
             current_user: CurrentUserSchema = Depends(require_min_role(role)),
             db: Session = Depends(get_db),
     ) -> CurrentUserSchema:
-        if not user_exists_for_role(db, current_user.id, current_user.role):
+        redis = getattr(request.app.state, "redis", None)
+        token = request.cookies.get("access_token")
+        key = _auth_cache_key(token) if redis and token else None
+
+        if key:
+            try:
+                if await redis.get(key) is not None:
+                    return current_user
+            except RedisError:
+                logger.warning("Auth_cache_read_failed")
+                key = None
+
+        if not await run_in_threadpool(user_exists_for_role, db, current_user.id, current_user.role):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=USER_NOT_FOUND,
             )
+
+        if key:
+            try:
+                await redis.setex(key, AUTH_CACHE_TTL, orjson.dumps(current_user.model_dump(mode="json")))
+            except RedisError:
+                logger.warning("Auth_cache_write_failed")
         return current_user
 
     return dependency
+
+
+# Shared instances, so routes reuse one dependency object per role.
+require_staff = require_min_role(UserRole.staff)
+require_moderator = require_min_role(UserRole.moderator)
+require_valid_staff = require_valid_user(UserRole.staff)
+require_valid_client = require_valid_user(UserRole.client)
@@ -4,9 +4,11 @@ configure_logging()
 
 import logging
 from flask import Flask, g
+from sqlalchemy.orm import scoped_session
 
 from flask_app.blueprints import register_blueprints
-from flask_app.extensions import cache, limiter, jwt, redis_client
+from flask_app.extensions import cache, limiter, jwt
+from flask_app.responses import ORJSONProvider
 from infrastructure.db.engine import engine, SessionLocal
 from infrastructure.db.base import Base
 from flask_app.config import Config
@@ -16,13 +18,22 @@ from domain.core.constants import RedisPrefix
 
 logger = logging.getLogger(__name__)
 
+# Thread-local registry: each worker thread gets its own session for the request.
+ScopedSession = scoped_session(SessionLocal)
+
 
 def create_app(base_config='domain.core.settings.Settings', auth_config='flask_app.config.Config'):
     app = Flask(__name__, static_folder='../frontend', static_url_path='/')
+    app.json = ORJSONProvider(app)
     app.config.from_object(base_config)
     app.config.from_object(auth_config)
 
-    if redis_client:
+    # Chosen from config alone: no Redis round trip at startup. If Redis is down at runtime,
+    # cached_json_response and invalidate_cached_json log and serve without the cache.
+    if app.config.get("CACHE_TYPE"):
+        logger.info("Cache_type_from_config type=%s", app.config["CACHE_TYPE"])
+
+    elif settings.REDIS_URL:
         app.config.update(
             CACHE_TYPE="RedisCache",
             CACHE_REDIS_URL=settings.REDIS_URL,
@@ -36,7 +47,7 @@ def create_app(base_config='domain.core.settings.Settings', auth_config='flask_a
             CACHE_TYPE="SimpleCache",
         )
 
-        logger.warning("Redis_unavailable_using_SimpleCache")
+        logger.warning("Redis_not_configured_using_SimpleCache")
     cache.init_app(app)
     limiter.init_app(app)
     jwt.init_app(app)
@@ -47,7 +58,7 @@ def create_app(base_config='domain.core.settings.Settings', auth_config='flask_a
 
     @app.before_request
     def create_session():
-        g.db = SessionLocal()
+        g.db = ScopedSession()
         g.db.rollback_needed = False
 
     @app.teardown_request
@@ -65,6 +76,6 @@ def create_app(base_config='domain.core.settings.Settings', auth_config='flask_a
             db.rollback()
             logger.exception("Session_cleanup_failed")
         finally:
-            db.close()
+            ScopedSession.remove()
 
     return app
@@ -1,12 +1,16 @@
 from datetime import datetime
 from flask import Blueprint, request, jsonify, g
 from flask_jwt_extended import create_access_token, set_access_cookies, unset_jwt_cookies
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from pydantic import TypeAdapter, ValidationError
 import logging
+import os
+import threading
 
-from flask_app.extensions import cache, limiter
+from flask_app.extensions import limiter
+from flask_app.responses import invalidate_cached_json, json_response, ndjson_response
 from flask_app.security import role_required, require_active_user
+from flask_app.validation import parse_json_body, query_flag
 from utils.images import process_image_upload
 from domain.core.constants import CacheNamespace
 from domain.core.errors import NotFoundError, ConflictError, DomainError, DomainValidationError
@@ -16,9 +20,19 @@ from utils.enums import UserRole
 
 logger = logging.getLogger(__name__)
 
+# Caps concurrent Pillow decodes per process, like IMAGE_LIMITER in the FastAPI app.
+IMAGE_SLOTS = threading.BoundedSemaphore(os.cpu_count() or 1)
+
 admin_bp = Blueprint('admin', __name__, url_prefix='/api/admin')
 
 
+REGISTER_ADAPTER = TypeAdapter(schemas.RegisterRequestSchema)
+LOGIN_ADAPTER = TypeAdapter(schemas.LoginRequestSchema)
+DISH_ADAPTER = TypeAdapter(schemas.DishUpdateSchema)
+COUPON_ADAPTER = TypeAdapter(schemas.CouponCreateSchema)
+COMMENT_STATUS_ADAPTER = TypeAdapter(schemas.CommentStatusUpdate)
+
+
 @admin_bp.route('/me', methods=['GET'])
 @role_required(UserRole.staff)
 @require_active_user()
@@ -29,27 +43,26 @@ def get_me():
 @admin_bp.route("/auth/register", methods=["POST"])
 @limiter.limit("10 per hour")
 def register_endpoint():
-    data = request.get_json(silent=True)
-    if not data:
-        return jsonify(detail="Invalid JSON"), 400
     try:
-        auth_data = schemas.RegisterRequestSchema.model_validate(data)
+        auth_data = parse_json_body(REGISTER_ADAPTER)
+    except ValidationError as e:
+        return jsonify(detail=str(e)), 422
+    if auth_data is None:
+        return jsonify(detail="Invalid JSON"), 400
 
+    try:
         user_id = services.register_staff(g.db, auth_data)
-        logger.info(f"registered_user user={user_id}")
+        logger.info("registered_user user=%s", user_id)
 
-    except IntegrityError:
+    except ConflictError as e:
         g.db.rollback_needed = True
-        return jsonify(detail=f"Email {data['email']} вже використана"), 409
+        return jsonify(detail=str(e)), 409
 
     except SQLAlchemyError:
         g.db.rollback_needed = True
-        logger.exception(f"Failed_to_register_user")
+        logger.exception("Failed_to_register_user")
         return jsonify(detail="Не вдалося зареєструвати користувача"), 500
 
-    except ValidationError as e:
-        return jsonify(detail=str(e)), 422
-
     access_token = create_access_token(
         identity=str(user_id),
         additional_claims={"role": UserRole.staff.value}
@@ -62,14 +75,12 @@ def register_endpoint():
 @admin_bp.route('/auth/login', methods=['POST'])
 @limiter.limit("5 per hour", key_func=lambda: (request.get_json(silent=True) or {}).get("email", ""))
 def login_endpoint():
-    data = request.get_json(silent=True)
-    if not data:
-        return jsonify(detail="Invalid JSON"), 400
-
     try:
-        auth_data = schemas.LoginRequestSchema.model_validate(data)
+        auth_data = parse_json_body(LOGIN_ADAPTER)
     except ValidationError as e:
         return jsonify(detail=str(e)), 422
+    if auth_data is None:
+        return jsonify(detail="Invalid JSON"), 400
 
     user = services.authenticate_staff(g.db, auth_data)
     if not user:
@@ -94,15 +105,32 @@ def logout_endpoint():
 @admin_bp.route('/orders', methods=['GET'])
 @role_required(UserRole.staff, inject_user=False)
 def get_orders_endpoint():
-    only_uncompleted = request.args.get(
-        'only_uncompleted',
-        default='true'
-    ).lower() == 'true'
+    only_uncompleted = query_flag('only_uncompleted')
 
-    orders = services.get_orders(g.db, only_uncompleted)
-    orders_data = [o.model_dump() for o in orders]
+    if query_flag('stream', default=False):
+        # Full order history can be large: stream rows and send the count up front as a header.
+        total = services.get_orders_count(g.db, only_uncompleted)
+        return ndjson_response(
+            services.iter_orders(g.db, only_uncompleted),
+            headers={"X-Total-Count": str(total)},
+        ), 200
+
+    orders, total = services.get_orders(g.db, only_uncompleted)
+
+    return json_response({"orders": orders, "orders_count": total}), 200
+
+
+@admin_bp.route('/overview', methods=['GET'])
+@role_required(UserRole.staff, inject_user=False)
+def get_overview_endpoint():
+    orders, total = services.get_orders(g.db, only_uncompleted=True)
+    unread_notifications_count = services.count_unread_notifications(g.db)
 
-    return jsonify(orders=orders_data, orders_count=len(orders)), 200
+    return json_response({
+        "orders": orders,
+        "orders_count": total,
+        "unread_notif_count": unread_notifications_count,
+    }), 200
 
 
 @admin_bp.route('/orders/count', methods=['GET'])
@@ -149,17 +177,17 @@ def statistics_endpoint():
     except ValueError:
         return jsonify(detail="Invalid date format. Use YYYY-MM-DD"), 400
 
-    return jsonify(
-        sales_summary=sales_summary.model_dump(),
-        dish_order_stats=dish_order_stats.model_dump(),
-    ), 200
+    return json_response({
+        "sales_summary": sales_summary,
+        "dish_order_stats": dish_order_stats,
+    }), 200
 
 
 @admin_bp.route('/menu', methods=['GET'])
 @role_required(UserRole.staff, inject_user=False)
 def get_menu_endpoint():
     menu = services.build_staff_menu(g.db)
-    return jsonify(menu.model_dump()), 200
+    return json_response(menu), 200
 
 
 @admin_bp.route('/images', methods=['POST'])
@@ -170,7 +198,8 @@ def upload_image_endpoint():
 
     file = request.files['image']
     try:
-        filename = process_image_upload(file, g.current_user["id"])
+        with IMAGE_SLOTS:
+            filename = process_image_upload(file, g.current_user["id"])
 
     except NotFoundError as e:
         return jsonify(detail=str(e)), 404
@@ -194,39 +223,34 @@ def update_categories_endpoint():
     services.update_categories(g.db, data["category_names"])
     logger.info("Categories_updated")
 
-    cache.delete(CacheNamespace.MENU)
+    invalidate_cached_json(CacheNamespace.MENU)
     return jsonify(message="Категорії оновлено"), 200
 
 
 @admin_bp.route('/dishes', methods=['POST'])
 @role_required(UserRole.staff, inject_user=False)
 def create_or_update_dish_endpoint():
-    data = request.get_json(silent=True)
-    if not data:
-        return jsonify(detail="Invalid JSON"), 400
-
     try:
-        dish = schemas.DishUpdateSchema.model_validate(data)
-        services.create_or_update_dish(g.db, dish)
-        logger.info(f"Dish_saved code={dish.code}")
-
+        dish = parse_json_body(DISH_ADAPTER)
     except ValidationError as e:
         return jsonify(detail=str(e)), 422
+    if dish is None:
+        return jsonify(detail="Invalid JSON"), 400
+
+    services.create_or_update_dish(g.db, dish)
+    logger.info("Dish_saved code=%s", dish.code)
 
-    cache.delete(CacheNamespace.MENU)
+    invalidate_cached_json(CacheNamespace.MENU)
     return jsonify(message=f"Страву з кодом {dish.code} збережено"), 200
 
 
 @admin_bp.route('/notifications', methods=['GET'])
 @role_required(UserRole.staff, inject_user=False)
 def get_notifications_endpoint():
-    only_unread = request.args.get(
-        'only_unread',
-        default='true'
-    ).lower() == 'true'
+    only_unread = query_flag('only_unread')
 
     notifications = services.get_notifications(only_unread, g.db)
-    return jsonify([n.model_dump() for n in notifications]), 200
+    return json_response(notifications), 200
 
 
 @admin_bp.route('/notifications/unread/count', methods=['GET'])
@@ -246,7 +270,7 @@ def mark_notification_read_endpoint(notification_id: int):
         g.db.rollback_needed = True
         return jsonify(detail=str(e)), 404
 
-    logger.info(f"notification_marked_read notification_id={notification_id} user_id={user_id}")
+    logger.info("notification_marked_read notification_id=%s user_id=%s", notification_id, user_id)
     return jsonify(
         message=f"Сповіщення:{notification_id} помічене як прочитане"
     ), 200
@@ -256,23 +280,22 @@ def mark_notification_read_endpoint(notification_id: int):
 @role_required(UserRole.staff, inject_user=False)
 def get_coupons_endpoint():
     coupons = services.get_coupons(g.db)
-    return jsonify([c.model_dump() for c in coupons]), 200
+    return json_response(coupons), 200
 
 
 @admin_bp.route('/coupons', methods=['POST'])
 @role_required(UserRole.staff, inject_user=False)
 def create_coupon_endpoint():
-    data = request.get_json(silent=True)
-    if not data:
+    try:
+        coupon_data = parse_json_body(COUPON_ADAPTER)
+    except ValidationError as e:
+        return jsonify(detail=str(e)), 422
+    if coupon_data is None:
         return jsonify(detail="Invalid JSON"), 400
 
     try:
-        coupon_data = schemas.CouponCreateSchema.model_validate(data)
         coupon_id = services.create_coupon(g.db, coupon_data)
-        logger.info(f"Coupon_added id={coupon_id}")
-
-    except ValidationError as e:
-        return jsonify(detail=str(e)), 422
+        logger.info("Coupon_added id=%s", coupon_id)
 
     except ConflictError as e:
         g.db.rollback_needed = True
@@ -286,7 +309,7 @@ def create_coupon_endpoint():
 def deactivate_coupon_endpoint(coupon_id: int):
     try:
         services.deactivate_coupon(g.db, coupon_id)
-        logger.info(f"Coupon_deactivated id={coupon_id}")
+        logger.info("Coupon_deactivated id=%s", coupon_id)
     except NotFoundError as e:
         g.db.rollback_needed = True
         return jsonify(detail=str(e)), 404
@@ -300,28 +323,26 @@ def deactivate_coupon_endpoint(coupon_id: int):
 @admin_bp.route('/comments/<int:comment_id>', methods=['PATCH'])
 @role_required(UserRole.moderator)
 def update_comment_status_endpoint(comment_id: int):
-    data = request.get_json(silent=True)
-    if not data:
+    try:
+        payload = parse_json_body(COMMENT_STATUS_ADAPTER)
+    except ValidationError as e:
+        return jsonify(detail=e.errors()), 422
+    if payload is None:
         return jsonify(detail="Invalid JSON"), 400
 
     try:
-        payload = schemas.CommentStatusUpdate.model_validate(data)
         new_status = payload.status
-
         services.update_comment_status(g.db, g.current_user["id"], comment_id, new_status)
 
-    except ValidationError as e:
-        return jsonify(detail=e.errors()), 422
-
     except NotFoundError as e:
         g.db.rollback_needed = True
         return jsonify(detail=str(e)), 404
 
     except Exception as e:
         g.db.rollback_needed = True
-        logger.exception(f"Failed_to_update_comment id={comment_id}")
+        logger.exception("Failed_to_update_comment id=%s", comment_id)
         return jsonify(detail=str(e)), 500
 
-    cache.delete(CacheNamespace.COMMENTS)
+    invalidate_cached_json(CacheNamespace.COMMENTS)
 
     return jsonify(message=f"Коментар {comment_id} змінив статус на {new_status.value}")
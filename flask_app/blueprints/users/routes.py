@@ -1,22 +1,26 @@
 from flask_jwt_extended import create_access_token, set_access_cookies
-from flask import Blueprint, request, jsonify, g
-from sqlalchemy.exc import IntegrityError
-from pydantic import ValidationError
+from flask import Blueprint, jsonify, g
+from pydantic import TypeAdapter, ValidationError
 import logging
 
-from flask_app.extensions import cache, limiter
+from flask_app.extensions import limiter
+from flask_app.responses import cached_json_response
 from domain import services
 from utils.discounts import calculate_discount
 from domain import schemas
 from domain.core.errors import NotFoundError, ConflictError, DomainValidationError
 from domain.core.constants import CacheNamespace
 from flask_app.security import require_active_user, role_required
+from flask_app.validation import parse_json_body
 from utils.enums import UserRole
 
 logger = logging.getLogger(__name__)
 
 users_bp = Blueprint('users', __name__, url_prefix='/api/users')
 
+COMMENT_ADAPTER = TypeAdapter(schemas.CommentCreateSchema)
+ORDER_ADAPTER = TypeAdapter(schemas.OrderCreateSchema)
+
 
 @users_bp.route('/me', methods=['GET'])
 @role_required()
@@ -41,25 +45,24 @@ def create_user_endpoint():
 
 
 @users_bp.route('/comments', methods=['GET'])
-@cache.cached(timeout=3600, key_prefix=CacheNamespace.COMMENTS)
 def get_comments_endpoint():
-    comments = services.get_comments(g.db, 10)
-
-    return jsonify(comments=[c.model_dump() for c in comments]), 200
+    return cached_json_response(
+        CacheNamespace.COMMENTS,
+        lambda: {"comments": services.get_comments(g.db, 10)},
+        timeout=3600,
+    )
 
 
 @users_bp.route('/comments', methods=['POST'])
 @role_required()
 @limiter.limit("2 per hour")
 def create_comment_endpoint():
-    json_data = request.get_json(silent=True)
-    if not json_data:
-        return jsonify(detail="No comment data received"), 400
-
     try:
-        comment = schemas.CommentCreateSchema.model_validate(json_data)
+        comment = parse_json_body(COMMENT_ADAPTER)
     except ValidationError as e:
         return jsonify(detail=str(e)), 422
+    if comment is None:
+        return jsonify(detail="No comment data received"), 400
 
     comment_id = services.create_comment(g.db, g.current_user["id"], comment)
 
@@ -67,10 +70,12 @@ def create_comment_endpoint():
 
 
 @users_bp.route('/menu', methods=['GET'])
-@cache.cached(timeout=3600, key_prefix=CacheNamespace.MENU)
 def get_user_menu():
-    menu = services.build_user_menu(g.db)
-    return jsonify(menu.model_dump()), 200
+    return cached_json_response(
+        CacheNamespace.MENU,
+        lambda: services.build_user_menu(g.db),
+        timeout=3600,
+    )
 
 
 @users_bp.route('/discount', methods=['GET'])
@@ -84,15 +89,12 @@ def get_discount_endpoint():
 @users_bp.route('/order', methods=['POST'])
 @role_required()
 def place_order_endpoint():
-    json_data = request.get_json(silent=True)
-    if not json_data:
-        return jsonify(detail="No order data received"), 400
-
     try:
-        order_data = schemas.OrderCreateSchema.model_validate(json_data)
-
+        order_data = parse_json_body(ORDER_ADAPTER)
     except ValidationError as e:
         return jsonify(detail=str(e)), 422
+    if order_data is None:
+        return jsonify(detail="No order data received"), 400
 
     order = services.create_order(g.db, order_data, g.current_user["id"])
     return jsonify(order.model_dump()), 201
@@ -104,16 +106,14 @@ def like_dish_endpoint(dish_code: str):
     user_id = g.current_user["id"]
     try:
         services.add_dish_like(g.db, user_id, dish_code)
-        logger.info(f"User_liked_dish user={user_id} dish={dish_code}")
+        logger.info("User_liked_dish user=%s dish=%s", user_id, dish_code)
 
     except NotFoundError as e:
         g.db.rollback_needed = True
         return jsonify(detail=str(e)), 404
 
-    except IntegrityError:
-        # duplicate like or constraint violation
-        g.db.rollback_needed = True
-        return jsonify(detail="Ви вже оцінювали цей продукт"), 409
+    except ConflictError as e:
+        return jsonify(detail=str(e)), 409
 
     return jsonify(message="Вподобання додано"), 200
 
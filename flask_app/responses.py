@@ -0,0 +1,119 @@
+from collections.abc import Callable, Iterable
+from decimal import Decimal
+from typing import Any
+import hashlib
+import logging
+import orjson
+from flask import Response, request, stream_with_context
+from flask.json.provider import JSONProvider
+from pydantic import TypeAdapter
+
+from flask_app.extensions import cache
+
+logger = logging.getLogger(__name__)
+
+_json_adapter = TypeAdapter(Any)
+
+# Part of every cached_json_response key. Bump it whenever the stored value changes shape,
+# so entries left by an older release or by @cache.cached under the bare key are never read back.
+CACHED_JSON_VERSION = 2
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson; dates are emitted as ISO 8601."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS),
+            mimetype="application/json",
+        )
+
+
+def json_response(content: Any) -> Response:
+    """
+    Serialize service-layer schemas straight to JSON bytes in pydantic-core.
+
+    Skips the model_dump() -> dict -> jsonify round trip for list and menu endpoints.
+    """
+    return Response(_json_adapter.dump_json(content), mimetype="application/json")
+
+
+def ndjson_response(items: Iterable[Any], headers: dict[str, str] | None = None) -> Response:
+    """
+    Stream one JSON document per line as `items` are produced.
+
+    The request context, and with it g.db, stays open until the last line is sent.
+    """
+    return Response(
+        stream_with_context(_json_adapter.dump_json(item) + b"\n" for item in items),
+        mimetype="application/x-ndjson",
+        headers=headers,
+    )
+
+
+def _cached_json_key(key: str) -> str:
+    return f"{key}:json:v{CACHED_JSON_VERSION}"
+
+
+def _is_cached_json(value: Any) -> bool:
+    return (
+        isinstance(value, tuple) and len(value) == 2
+        and isinstance(value[0], str) and isinstance(value[1], bytes)
+    )
+
+
+def invalidate_cached_json(key: str):
+    """Drop the entry cached_json_response keeps for `key`; a cache outage is logged, not raised."""
+    try:
+        cache.delete(_cached_json_key(key))
+    except Exception:
+        logger.exception("Cache_delete_failed key=%s", key)
+
+
+def cached_json_response(key: str, build: Callable[[], Any], timeout: int) -> Response:
+    """
+    Serve a response body stored in the cache as ready-made JSON bytes.
+
+    On a miss `build()` runs once and its serialized bytes are cached under `key`
+    together with their ETag, so hits skip the view, pydantic and the JSON provider
+    entirely, and clients that present a matching If-None-Match get an empty 304.
+    Like @cache.cached, a failing cache backend only costs the cache: the body is
+    built and served as usual.
+    """
+    cache_key = _cached_json_key(key)
+    try:
+        cached = cache.get(cache_key)
+    except Exception:
+        logger.exception("Cache_get_failed key=%s", key)
+        cached = None
+
+    # Anything but an (etag, body) pair, e.g. a half-upgraded deploy, is rebuilt like a miss.
+    if not _is_cached_json(cached):
+        body = _json_adapter.dump_json(build())
+        cached = (hashlib.blake2b(body, digest_size=16).hexdigest(), body)
+        try:
+            cache.set(cache_key, cached, timeout=timeout)
+        except Exception:
+            logger.exception("Cache_set_failed key=%s", key)
+
+    etag, body = cached
+    response = Response(body, mimetype="application/json")
+    response.set_etag(etag)
+    # Revalidate every time: admin edits must show up at once, a 304 is still cheap.
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
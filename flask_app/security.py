@@ -1,20 +1,28 @@
 from flask import abort, g
 from functools import wraps
-from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity
+from flask_jwt_extended import verify_jwt_in_request, get_jwt, get_jwt_identity
 
 from domain.core.constants import ROLE_ORDER
 from utils.enums import UserRole
 from domain import services
 
 
+def _verified_claims() -> dict:
+    """Verify the JWT once per request; stacked role checks reuse the claims kept on g."""
+    if "jwt_claims" not in g:
+        verify_jwt_in_request()
+        g.jwt_claims = get_jwt()
+    return g.jwt_claims
+
+
 def role_required(required_role: UserRole = UserRole.client, inject_user=True):
     """Validate role and optionally store current_user in g."""
+    min_level = ROLE_ORDER[required_role]
 
     def decorator(fn):
         @wraps(fn)
-        @jwt_required()
         def wrapper(*args, **kwargs):
-            jwt_data = get_jwt()
+            jwt_data = _verified_claims()
 
             role_value = jwt_data.get("role")
             try:
@@ -22,7 +30,7 @@ def role_required(required_role: UserRole = UserRole.client, inject_user=True):
             except ValueError:
                 abort(403, description="INVALID_ROLE")
 
-            if ROLE_ORDER.get(role, 0) < ROLE_ORDER[required_role]:
+            if ROLE_ORDER.get(role, 0) < min_level:
                 abort(403, description="INSUFFICIENT_ROLE")
 
             if inject_user:
@@ -0,0 +1,48 @@
+from typing import TypeVar
+import orjson
+from flask import request
+from pydantic import TypeAdapter, ValidationError
+
+T = TypeVar("T")
+
+_TRUTHY = frozenset({"1", "true", "t", "yes", "y", "on"})
+
+# Longest body still worth decoding to check for an empty JSON value such as `{ }` or `null`.
+_EMPTY_BODY_MAX = 32
+
+
+def _is_empty_json(body: bytes) -> bool:
+    if len(body) > _EMPTY_BODY_MAX:
+        return False
+    try:
+        return not orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return False
+
+
+def parse_json_body(adapter: TypeAdapter[T]) -> T | None:
+    """
+    Validate the raw request body with a single `validate_json` pass.
+
+    Returns None when the body is missing, is not JSON or is an empty JSON value
+    like `{}` (callers answer 400); raises ValidationError when well-formed JSON
+    doesn't match the schema.
+    """
+    body = request.get_data()
+    if not body or not request.is_json or _is_empty_json(body):
+        return None
+
+    try:
+        return adapter.validate_json(body)
+    except ValidationError as e:
+        if any(error["type"] == "json_invalid" for error in e.errors()):
+            return None
+        raise
+
+
+def query_flag(name: str, default: bool = True) -> bool:
+    """Read a boolean query parameter; an absent parameter returns `default`."""
+    value = request.args.get(name)
+    if value is None:
+        return default
+    return value.lower() in _TRUTHY
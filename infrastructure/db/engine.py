@@ -1,12 +1,33 @@
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url
 
 from domain.core.settings import settings
 
+database_url = make_url(settings.DATABASE_URL)
+
+
+def _engine_options() -> dict:
+    if database_url.get_backend_name() == "sqlite":
+        return {"connect_args": {"check_same_thread": False}}
+
+    options = {
+        # LIFO keeps a few hot connections in use; recycling retires them before server-side idle timeouts.
+        "pool_size": 20,
+        "max_overflow": 10,
+        "pool_recycle": 1800,
+        "pool_use_lifo": True,
+        "pool_pre_ping": False,
+    }
+    if database_url.get_driver_name() == "psycopg":
+        # psycopg 3 prepares a statement server-side once the same query text has run this many times.
+        options["connect_args"] = {"prepare_threshold": 5}
+    return options
+
+
 engine = create_engine(
-    settings.DATABASE_URL,
+    database_url,
     echo=False,
-    connect_args={"check_same_thread": False} if settings.DATABASE_URL.startswith("sqlite") else {}
+    **_engine_options(),
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
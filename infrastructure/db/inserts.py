@@ -0,0 +1,41 @@
+from typing import Any
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+_ON_CONFLICT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def insert_ignore(db: Session, model: type, conflict_columns: list, **values: Any) -> Any | None:
+    """
+    Insert a row in one statement unless it hits a unique constraint.
+
+    Returns the new primary key, or None when a conflicting row already exists.
+    """
+    pk = model.__mapper__.primary_key[0]
+    dialect = db.get_bind().dialect.name
+
+    dialect_insert = _ON_CONFLICT_INSERTS.get(dialect)
+    if dialect_insert is not None:
+        stmt = (
+            dialect_insert(model)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=conflict_columns)
+            .returning(pk)
+        )
+        return db.execute(stmt).scalar()
+
+    if dialect in ("mysql", "mariadb"):
+        result = db.execute(insert(model).values(**values).prefix_with("IGNORE"))
+        return result.lastrowid if result.rowcount else None
+
+    try:
+        with db.begin_nested():
+            result = db.execute(insert(model).values(**values))
+    except IntegrityError:
+        return None
+    return result.inserted_primary_key[0]
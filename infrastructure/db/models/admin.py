@@ -1,5 +1,5 @@
 from datetime import datetime, date
-from sqlalchemy import ForeignKey, Enum, DateTime, Date, String
+from sqlalchemy import ForeignKey, Enum, DateTime, Date, String, Index, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from utils.enums import NotificationType
@@ -43,6 +43,15 @@ class Staff(Base):
 
 class AdminNotification(Base):
     __tablename__ = "admin_notifications"
+    __table_args__ = (
+        Index(
+            "notif_unread_idx",
+            "created_at",
+            "id",
+            postgresql_where=text("is_read IS false"),
+            sqlite_where=text("is_read IS 0"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str] = mapped_column(String(50))
@@ -50,7 +59,7 @@ class AdminNotification(Base):
     type: Mapped[NotificationType] = mapped_column(
         Enum(NotificationType), default=NotificationType.info
     )
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=func.now())
     created_staff_id: Mapped[int | None] = mapped_column(
         ForeignKey("staff.id"),
         nullable=True
@@ -94,7 +103,7 @@ class DishOrdersStats(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     code: Mapped[str] = mapped_column(String(10), unique=True)
-    orders: Mapped[int]
+    orders: Mapped[int] = mapped_column(index=True)
 
     def __repr__(self):
         return f"<Dishes_orders_stats {self.code}>"
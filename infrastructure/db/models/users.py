@@ -1,5 +1,6 @@
 from datetime import datetime, date
-from sqlalchemy import Table, Column, ForeignKey, DateTime, Date, String, Integer, JSON, Numeric, Enum
+from sqlalchemy import Table, Column, ForeignKey, DateTime, Date, String, Integer, JSON, Numeric, Enum, Index, func, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from infrastructure.db.base import Base
@@ -17,7 +18,7 @@ class User(Base):
     __tablename__ = 'users'
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=func.now())
 
     orders: Mapped[list["Order"]] = relationship(back_populates="user")
     comments: Mapped[list["Comment"]] = relationship(back_populates="user")
@@ -72,7 +73,7 @@ class DishLike(Base):
 
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
     dish_code: Mapped[str] = mapped_column(ForeignKey("dishes.code"), primary_key=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=func.now())
 
     user: Mapped["User"] = relationship(back_populates="like_rel")
     dish: Mapped["Dish"] = relationship(back_populates="like_rel")
@@ -100,9 +101,19 @@ class DishExtra(Base):
 
 class Order(Base):
     __tablename__ = 'orders'
+    __table_args__ = (
+        # Partial index for the open-orders queue; predicates match what the ORM emits per dialect.
+        Index(
+            "orders_open_idx",
+            "created_at",
+            "id",
+            postgresql_where=text("completed_by IS NULL"),
+            sqlite_where=text("completed_by IS NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=func.now())
     completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     completed_by: Mapped[int | None] = mapped_column(
         ForeignKey("staff.id"),
@@ -110,11 +121,12 @@ class Order(Base):
     )
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
     table: Mapped[int | None] = mapped_column(nullable=True)
-    original_cost: Mapped[float] = mapped_column(Numeric(10, 2))
+    # Exact NUMERIC storage, but returned as float to match the schemas instead of allocating Decimals.
+    original_cost: Mapped[float] = mapped_column(Numeric(10, 2, asdecimal=False))
     loyalty_pct: Mapped[int] = mapped_column(default=0)
     coupon_pct: Mapped[int] = mapped_column(default=0)
-    final_cost: Mapped[float] = mapped_column(Numeric(10, 2))
-    order_details: Mapped[dict] = mapped_column(JSON)
+    final_cost: Mapped[float] = mapped_column(Numeric(10, 2, asdecimal=False))
+    order_details: Mapped[dict] = mapped_column(JSON().with_variant(JSONB(), "postgresql"))
 
     user: Mapped["User"] = relationship(back_populates="orders")
     staff: Mapped["Staff"] = relationship("Staff", back_populates="orders")
@@ -129,7 +141,7 @@ class Comment(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
     user_name: Mapped[str] = mapped_column(String(20))
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=func.now())
     comment_text: Mapped[str] = mapped_column(String(200))
     status: Mapped[CommentStatus] = mapped_column(
         Enum(CommentStatus, native_enum=False),
@@ -155,13 +167,21 @@ class Comment(Base):
 
 class Coupon(Base):
     __tablename__ = 'coupons'
+    __table_args__ = (
+        Index(
+            "coupons_active_idx",
+            "expires_at",
+            postgresql_where=text("is_active IS true"),
+            sqlite_where=text("is_active IS 1"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     code: Mapped[str] = mapped_column(String(20), unique=True)
     discount_value: Mapped[int] = mapped_column(default=0)
     is_active: Mapped[bool] = mapped_column(default=True)
     expires_at: Mapped[date | None] = mapped_column(Date, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=func.now())
     used_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     user_id: Mapped[int | None] = mapped_column(ForeignKey("users.id"), nullable=True)
 
@@ -1,10 +1,27 @@
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 from domain.core.settings import settings
 
+_listener: QueueListener | None = None
+
+
+def _stop_listener():
+    # Flushes records still queued; also runs at interpreter exit.
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
 
 def configure_logging():
+    global _listener
+
     settings.LOG_FILE_PATH.parent.mkdir(parents=True, exist_ok=True)
 
     root_logger = logging.getLogger()
@@ -12,6 +29,8 @@ def configure_logging():
     if root_logger.handlers:
         root_logger.handlers.clear()
 
+    _stop_listener()
+
     root_logger.setLevel(logging.INFO)
 
     formatter = logging.Formatter(
@@ -28,5 +47,9 @@ def configure_logging():
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
 
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    # Request threads only enqueue records; file and console I/O happen on the listener thread.
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from functools import lru_cache
 import redis
 import redis.asyncio as aioredis
 
@@ -6,42 +8,80 @@ from domain.core.settings import settings
 
 logger = logging.getLogger(__name__)
 
+REDIS_MAX_CONNECTIONS = 50
+
+
+_sync_redis_seen_up = False
+
+
+@lru_cache(maxsize=1)
+def get_shared_sync_redis() -> redis.Redis:
+    """Process-wide sync client; nothing is sent until the first command."""
+    return redis.Redis.from_url(
+        settings.REDIS_URL,
+        socket_connect_timeout=1,
+        socket_timeout=1,
+        socket_keepalive=True,
+        health_check_interval=30,
+        max_connections=REDIS_MAX_CONNECTIONS,
+    )
+
+
+def is_sync_redis_available() -> bool:
+    """Ping on first use; a success is remembered for the process, a failure is retried next call."""
+    global _sync_redis_seen_up
+    if _sync_redis_seen_up:
+        return True
 
-def get_sync_redis_client() -> redis.Redis | None:
     try:
-        client = redis.Redis.from_url(
-            settings.REDIS_URL,
-            socket_connect_timeout=1,
-            socket_timeout=1,
-        )
-        client.ping()
-        logger.info("Sync_Redis_available")
-        return client
+        get_shared_sync_redis().ping()
 
     except redis.RedisError:
         logger.warning("Sync_Redis_unavailable", exc_info=True)
-        return None
+        return False
 
     except Exception:
         logger.exception("Unexpected_error_during_Sync_Redis_init")
-        return None
+        return False
+
+    _sync_redis_seen_up = True
+    logger.info("Sync_Redis_available")
+    return True
+
+
+def get_sync_redis_client() -> redis.Redis | None:
+    return get_shared_sync_redis() if is_sync_redis_available() else None
+
+
+async def _close_quietly(client: aioredis.Redis | None) -> None:
+    # A failed check must not leave the client's connection pool behind.
+    if client is None:
+        return
+    try:
+        await client.close()
+    except Exception:
+        logger.warning("Async_Redis_close_failed", exc_info=True)
 
 
 async def get_async_redis_client() -> aioredis.Redis | None:
+    client = None
     try:
         client = aioredis.from_url(
             settings.REDIS_URL,
             socket_connect_timeout=1,
             socket_timeout=1,
+            max_connections=REDIS_MAX_CONNECTIONS,
         )
-        await client.ping()
+        await asyncio.wait_for(client.ping(), timeout=1)
         logger.info("Async_Redis_available")
         return client
 
-    except redis.RedisError:
+    except (redis.RedisError, asyncio.TimeoutError):
         logger.warning("Async_Redis_unavailable", exc_info=True)
+        await _close_quietly(client)
         return None
 
     except Exception:
         logger.exception("Unexpected_error_during_Async_Redis_init")
+        await _close_quietly(client)
         return None
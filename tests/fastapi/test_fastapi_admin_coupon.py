@@ -70,6 +70,24 @@ def test_create_coupon__unauthorized_access__returns_403_or_401(
     assert response.json() == {"detail": detail}
 
 
+@pytest.mark.parametrize("role, expected_status, detail", [
+    (UserRole.client, 403, INSUFFICIENT_ROLE),
+    (None, 401, NOT_AUTHENTICATED),
+])
+def test_create_coupon__unauthorized_access_with_invalid_body__returns_403_or_401(
+        client_by_role,
+        role,
+        expected_status,
+        detail,
+):
+    client = client_by_role(role)
+
+    response = client.post(COUPONS_URL, json={})
+
+    assert response.status_code == expected_status
+    assert response.json() == {"detail": detail}
+
+
 def test_create_coupon__code_already_exists__returns_409(
         authenticated_client,
         mocker,
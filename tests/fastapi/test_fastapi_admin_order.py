@@ -7,6 +7,7 @@ from utils.enums import UserRole
 order_id = 8
 ORDERS_URL = "/api/admin/orders"
 COMPLETE_URL = f"{ORDERS_URL}/{order_id}/complete"
+OVERVIEW_URL = "/api/admin/overview"
 
 
 @pytest.mark.parametrize("role, expected_status, detail", [
@@ -109,3 +110,23 @@ def test_complete_order__service_errors__returns_404_or_409(
 
     assert response.status_code == expected_status
     assert response.json() == {"detail": detail}
+
+
+def test_get_overview__staff_user__returns_orders_and_counts(authenticated_client, mocker):
+    mock_get_orders = mocker.patch(f"{ADMIN_SERVICES}.get_orders", return_value=([], 3))
+    mocker.patch(f"{ADMIN_SERVICES}.count_unread_notifications", return_value=2)
+    client = authenticated_client(role=UserRole.staff)
+
+    response = client.get(OVERVIEW_URL)
+
+    assert response.status_code == 200
+    assert response.json() == {"orders": [], "orders_count": 3, "unread_notif_count": 2}
+    mock_get_orders.assert_called_once()
+
+
+def test_get_overview__client_user__returns_403(authenticated_client):
+    client = authenticated_client(role=UserRole.client)
+
+    response = client.get(OVERVIEW_URL)
+
+    assert response.status_code == 403
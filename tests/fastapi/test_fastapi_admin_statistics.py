@@ -1,11 +1,14 @@
+import json
 import pytest
 
+from tests.fastapi.constants import ADMIN_SERVICES
 from utils.enums import UserRole
 from domain.core.errors import NOT_AUTHENTICATED, INSUFFICIENT_ROLE
 
 start_date = "2025-04-01"
 end_date = "2025-04-30"
 STATISTIC_URL = "/api/admin/statistics?startDate={start}&endDate={end}"
+STATISTIC_STREAM_URL = "/api/admin/statistics/stream?startDate={start}&endDate={end}"
 
 
 @pytest.mark.parametrize("role, expected_status, detail", [
@@ -51,3 +54,26 @@ def test_statistics__incorrect_date_order__returns_400(authenticated_client):
 
     assert response.status_code == 400
     assert response.json() == {"detail": "start_date must be before or equal to end_date"}
+
+
+def test_statistics_stream__staff_user__returns_ndjson_rows(authenticated_client, mocker):
+    rows = [
+        {"date": "01-04", "total_sales": 500.0, "avg_check_size": 250.0, "orders": 2, "returning_customers": 1},
+        {"date": "02-04", "total_sales": 0.0, "avg_check_size": 0.0, "orders": 0, "returning_customers": 0},
+    ]
+    mocker.patch(f"{ADMIN_SERVICES}.iter_sales_summary", return_value=iter(rows))
+    client = authenticated_client(role=UserRole.staff)
+
+    response = client.get(STATISTIC_STREAM_URL.format(start=start_date, end=end_date))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in response.text.splitlines()] == rows
+
+
+def test_statistics_stream__incorrect_date_order__returns_400(authenticated_client):
+    client = authenticated_client(role=UserRole.staff)
+
+    response = client.get(STATISTIC_STREAM_URL.format(start=end_date, end=start_date))
+
+    assert response.status_code == 400
@@ -1,8 +1,7 @@
 import pytest
-from sqlalchemy.exc import IntegrityError
 
 from tests.fastapi.constants import USERS_SERVICES
-from domain.core.errors import NotFoundError
+from domain.core.errors import NotFoundError, ConflictError
 from utils.enums import UserRole
 
 MENU_URL = "/api/users/menu"
@@ -47,7 +46,7 @@ def test_like_dish__dish_exists__returns_200(
 
 @pytest.mark.parametrize("response_error, expected_status, detail", [
     (NotFoundError("Not Found"), 404, "Not Found"),
-    (IntegrityError("", "", ""), 409, "Ви вже оцінювали цей продукт"),
+    (ConflictError("Ви вже оцінювали цей продукт"), 409, "Ви вже оцінювали цей продукт"),
 ])
 def test_like_dish__service_errors__returns_404_or_409(
         authenticated_client,
@@ -42,6 +42,15 @@ def test_place_order__unauthenticated__returns_401(api_client):
     assert response.status_code == 401
 
 
+def test_place_order__unauthenticated_with_invalid_payload__returns_401(api_client):
+    response = api_client.post(
+        ORDER_URL,
+        json={"order": "invalid_order"},
+    )
+
+    assert response.status_code == 401
+
+
 def test_place_order__invalid_payload__returns_422(authenticated_client):
     client = authenticated_client(role=UserRole.client)
 
@@ -122,6 +122,17 @@ def test_register__no_json_body__returns_400(clear_rate_limits, api_client):
     assert response.get_json() == {"detail": "Invalid JSON"}
 
 
+def test_register__malformed_json__returns_400(clear_rate_limits, api_client):
+    response = api_client.post(
+        REGISTER_URL,
+        data='{"email": ',
+        content_type="application/json"
+    )
+
+    assert response.status_code == 400
+    assert response.get_json() == {"detail": "Invalid JSON"}
+
+
 def test_register__server_error__returns_500(clear_rate_limits, api_client, mocker):
     mocker.patch(
         f"{ADMIN_SERVICES}.register_staff",
@@ -18,7 +18,7 @@ def test_update_comment_status__success__returns_200(authenticated_client, statu
     )
 
     mock_clear = mocker.patch(
-        f"{ADMIN_ROUTES}.cache.delete"
+        f"{ADMIN_ROUTES}.invalidate_cached_json"
     )
 
     response = client.patch(COMMENTS_URL, json={"status": status.value})
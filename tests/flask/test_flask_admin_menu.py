@@ -42,7 +42,7 @@ def test_update_categories__staff_user__returns_200(
         f"{ADMIN_SERVICES}.update_categories"
     )
     mock_from_thread_run = mocker.patch(
-        f"{ADMIN_ROUTES}.cache.delete"
+        f"{ADMIN_ROUTES}.invalidate_cached_json"
     )
 
     payload = {
@@ -99,7 +99,7 @@ def test_create_or_update_dish__staff_user__returns_200(
     )
 
     mock_from_thread_run = mocker.patch(
-        f"{ADMIN_ROUTES}.cache.delete"
+        f"{ADMIN_ROUTES}.invalidate_cached_json"
     )
 
     dish = make_dish_payload()
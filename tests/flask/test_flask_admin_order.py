@@ -1,3 +1,4 @@
+import json
 import pytest
 
 from tests.flask.constants import ADMIN_SERVICES
@@ -7,6 +8,7 @@ from utils.enums import UserRole
 order_id = 8
 ORDERS_URL = "/api/admin/orders"
 COMPLETE_URL = f"{ORDERS_URL}/{order_id}/complete"
+OVERVIEW_URL = "/api/admin/overview"
 
 
 @pytest.mark.parametrize("role, expected_status", [
@@ -32,6 +34,21 @@ def test_orders__access_by_role__returns_200_or_403_or_401(
         assert isinstance(data["orders_count"], int)
 
 
+def test_get_orders__stream__returns_ndjson_with_total_header(authenticated_client, mocker):
+    order = {"id": 1, "table": 3}
+    mock_iter_orders = mocker.patch(f"{ADMIN_SERVICES}.iter_orders", return_value=iter([order, order]))
+    mocker.patch(f"{ADMIN_SERVICES}.get_orders_count", return_value=2)
+    client = authenticated_client(role=UserRole.staff)
+
+    response = client.get(f"{ORDERS_URL}?only_uncompleted=false&stream=1")
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert response.headers["X-Total-Count"] == "2"
+    assert [json.loads(line) for line in response.data.splitlines()] == [order, order]
+    mock_iter_orders.assert_called_once()
+
+
 def test_get_orders_count__returns_count(
         authenticated_client,
         mocker,
@@ -106,3 +123,23 @@ def test_complete_order__service_errors__returns_404_or_409(
 
     assert response.status_code == expected_status
     assert response.get_json() == {"detail": detail}
+
+
+def test_get_overview__staff_user__returns_orders_and_counts(authenticated_client, mocker):
+    mock_get_orders = mocker.patch(f"{ADMIN_SERVICES}.get_orders", return_value=([], 3))
+    mocker.patch(f"{ADMIN_SERVICES}.count_unread_notifications", return_value=2)
+    client = authenticated_client(role=UserRole.staff)
+
+    response = client.get(OVERVIEW_URL)
+
+    assert response.status_code == 200
+    assert response.get_json() == {"orders": [], "orders_count": 3, "unread_notif_count": 2}
+    mock_get_orders.assert_called_once()
+
+
+def test_get_overview__client_user__returns_403(authenticated_client):
+    client = authenticated_client(role=UserRole.client)
+
+    response = client.get(OVERVIEW_URL)
+
+    assert response.status_code == 403
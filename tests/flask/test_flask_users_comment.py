@@ -1,5 +1,3 @@
-from flask import json
-
 from tests.factories.comment import make_comment_payload, make_comment_schema
 from tests.flask.constants import USERS_SERVICES
 from utils.enums import UserRole
@@ -17,7 +15,7 @@ def test_get_comments__comments_exist__returns_comments(api_client, mocker, clea
 
     response = api_client.get(COMMENTS_URL)
 
-    expected = json.loads(json.dumps(comment.model_dump()))
+    expected = comment.model_dump(mode="json")
 
     mock_get_comment.assert_called_once()
     assert response.status_code == 200
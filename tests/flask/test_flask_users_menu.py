@@ -1,8 +1,11 @@
 import pytest
-from sqlalchemy.exc import IntegrityError
+from flask import jsonify
 
+from flask_app.extensions import cache
+from flask_app.responses import _cached_json_key
+from domain.core.constants import CacheNamespace
 from tests.flask.constants import USERS_SERVICES
-from domain.core.errors import NotFoundError
+from domain.core.errors import NotFoundError, ConflictError
 from domain import schemas
 from utils.enums import UserRole
 
@@ -34,6 +37,63 @@ def test_get_menu__cached__returns_cached_result(api_client, mocker, clear_cache
     assert response.get_json() == {"dishes": {}, "categories": []}
 
 
+def test_get_menu__matching_etag__returns_304(api_client, mocker, clear_cache):
+    mocker.patch(
+        f"{USERS_SERVICES}.build_user_menu",
+        return_value=schemas.UserMenuResponseSchema(dishes={}, categories=[])
+    )
+
+    first = api_client.get(MENU_URL)
+    response = api_client.get(MENU_URL, headers={"If-None-Match": first.headers["ETag"]})
+
+    assert first.status_code == 200
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == first.headers["ETag"]
+
+
+def _assert_menu_rebuilt(api_client, mocker):
+    mock = mocker.patch(
+        f"{USERS_SERVICES}.build_user_menu",
+        return_value=schemas.UserMenuResponseSchema(dishes={}, categories=[])
+    )
+
+    response = api_client.get(MENU_URL)
+
+    assert mock.call_count == 1
+    assert response.status_code == 200
+    assert response.get_json() == {"dishes": {}, "categories": []}
+    assert "ETag" in response.headers
+
+
+def test_get_menu__view_result_left_by_cache_cached__is_ignored(app, api_client, mocker, clear_cache):
+    with app.test_request_context():
+        cache.set(CacheNamespace.MENU, (jsonify(dishes={}, categories=[]), 200))
+
+    _assert_menu_rebuilt(api_client, mocker)
+
+
+def test_get_menu__malformed_cache_entry__rebuilds_result(app, api_client, mocker, clear_cache):
+    with app.app_context():
+        cache.set(_cached_json_key(CacheNamespace.MENU), b'{"dishes": {}}')
+
+    _assert_menu_rebuilt(api_client, mocker)
+
+
+def test_get_menu__cache_backend_down__serves_uncached_result(api_client, mocker, clear_cache):
+    mocker.patch("flask_app.responses.cache.get", side_effect=ConnectionError("Redis down"))
+    mocker.patch("flask_app.responses.cache.set", side_effect=ConnectionError("Redis down"))
+    mocker.patch(
+        f"{USERS_SERVICES}.build_user_menu",
+        return_value=schemas.UserMenuResponseSchema(dishes={}, categories=[])
+    )
+
+    response = api_client.get(MENU_URL)
+
+    assert response.status_code == 200
+    assert response.get_json() == {"dishes": {}, "categories": []}
+
+
 def test_like_dish__dish_exists__returns_200(
         authenticated_client,
         mocker,
@@ -49,7 +109,7 @@ def test_like_dish__dish_exists__returns_200(
 
 @pytest.mark.parametrize("response_error, expected_status, detail", [
     (NotFoundError("Not Found"), 404, "Not Found"),
-    (IntegrityError("", "", ""), 409, "Ви вже оцінювали цей продукт"),
+    (ConflictError("Ви вже оцінювали цей продукт"), 409, "Ви вже оцінювали цей продукт"),
 ])
 def test_like_dish__service_errors__returns_404_or_409(
         authenticated_client,
@@ -1,5 +1,5 @@
 import pytest
-from sqlalchemy.exc import IntegrityError
+from domain.core.errors import ConflictError
 
 from domain import services
 from infrastructure.db.models.admin import Staff
@@ -17,9 +17,9 @@ def test_register_staff__valid_data__returns_persisted_staff_id(db_session):
     assert user.email == email
 
 
-def test_register_staff__email_already_exists__raises_integrity_error(db_session):
+def test_register_staff__email_already_exists__raises_conflict_error(db_session):
     services.register_staff(db_session, make_register_schema(email=email))
-    with pytest.raises(IntegrityError):
+    with pytest.raises(ConflictError):
         services.register_staff(db_session, make_register_schema(email=email))
 
 
@@ -60,6 +60,7 @@ def test_create_coupon__code_provided__uses_given_code(db_session):
 @pytest.mark.parametrize("expires_at", [
     "2025-10-30",
     None,
+    "",
 ])
 def test_create_coupon__expires_at_variants__stores_correct_value(db_session, expires_at):
     data = make_coupon_schema(expires_at=expires_at)
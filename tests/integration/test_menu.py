@@ -1,11 +1,10 @@
 import pytest
 from datetime import datetime
-from sqlalchemy.exc import IntegrityError
 
-from infrastructure.db.models.users import Dish, DishLike, Category
+from infrastructure.db.models.users import Dish, DishLike, Category, DishExtra
 from domain import services
 from domain import schemas
-from domain.core.errors import NotFoundError
+from domain.core.errors import NotFoundError, ConflictError
 from tests.factories.dish import make_dish_schema
 
 
@@ -97,6 +96,18 @@ def test_get_dishes__include_unpriced__returns_dishes(
     assert response.featured_dishes[1].root == {"Рекомендуємо": []}
 
 
+def test_get_dishes__dish_has_extras__returns_extras_map(db_session, sample_menu):
+    dish = db_session.get(Dish, "A1")
+    dish.extras.append(DishExtra(name="Cheese", price=20))
+    db_session.flush()
+    db_session.expire_all()
+
+    response = services.get_dishes(db_session, include_unpriced=False)
+
+    assert response.dishes["A1"].extras == {"Cheese": 20}
+    assert response.dishes["B1"].extras == {}
+
+
 def test_add_dish_like__dish_exists__creates_like_and_increments_counter(db_session, sample_menu):
     dish_before = db_session.get(Dish, "A1")
     assert dish_before.likes == 0
@@ -117,14 +128,16 @@ def test_add_dish_like__dish_does_not_exist__raises_not_found_error(db_session,
         services.add_dish_like(db_session, user_id=2, dish_code="A5")
 
 
-def test_add_dish_like__like_already_exists__raises_integrity_error(db_session, sample_menu):
+def test_add_dish_like__like_already_exists__raises_conflict_error(db_session, sample_menu):
     services.add_dish_like(db_session, user_id=2, dish_code="A1")
     dish_like = db_session.get(DishLike, (2, "A1"))
     assert dish_like is not None
 
-    with pytest.raises(IntegrityError):
+    with pytest.raises(ConflictError):
         services.add_dish_like(db_session, user_id=2, dish_code="A1")
 
+    assert db_session.get(Dish, "A1").likes == 1
+
 
 @pytest.mark.parametrize("include_unpriced, expected_categories", [
     (True, [{'Cat1': ['A1', 'A2']}, {'Cat2': ['B1', 'B2']}]),
@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from infrastructure.db.models.users import Order
 from domain import services
 from domain import schemas
-from domain.core.errors import ConflictError
+from domain.core.errors import ConflictError, NotFoundError
 from tests.factories.order import make_order_schema
 
 user_id = 5
@@ -47,14 +47,32 @@ def test_get_orders__include_uncompleted__returns_orders(
         only_uncompleted,
         expected_response
 ):
-    response = services.get_orders(db_session, only_uncompleted=only_uncompleted)
+    response, total = services.get_orders(db_session, only_uncompleted=only_uncompleted)
 
     assert all(isinstance(o, schemas.OrderSchema) for o in response)
+    assert total == len(response)
 
     result_items = {(o.table, o.final_cost) for o in response}
     assert result_items == expected_response
 
 
+@pytest.mark.parametrize("only_uncompleted, expected_tables", [
+    (True, [3]),
+    (False, [3, 4]),
+])
+def test_iter_orders__include_uncompleted__yields_orders(
+        db_session,
+        sample_orders,
+        only_uncompleted,
+        expected_tables
+):
+    orders = list(services.iter_orders(db_session, only_uncompleted=only_uncompleted))
+
+    assert all(isinstance(o, schemas.OrderSchema) for o in orders)
+    assert sorted(o.table for o in orders) == expected_tables
+    assert services.get_orders_count(db_session, only_uncompleted=only_uncompleted) == len(orders)
+
+
 def test_complete_order__order_uncompleted__sets_completed_fields(db_session, sample_orders):
     order = sample_orders["uncompleted"]
     services.complete_order(db_session, order.id, employee_id=user_id)
@@ -74,6 +92,11 @@ def test_complete_order__order_already_completed__raises_conflict_error(db_sessi
         services.complete_order(db_session, order.id, employee_id=user_id)
 
 
+def test_complete_order__order_does_not_exist__raises_not_found_error(db_session, sample_orders):
+    with pytest.raises(NotFoundError):
+        services.complete_order(db_session, 999, employee_id=user_id)
+
+
 def test_count__orders_exist__returns_total_count(db_session, sample_orders):
     count = services.get_orders_count(db_session)
 
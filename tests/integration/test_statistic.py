@@ -57,6 +57,14 @@ def test_get_sales_summary__date_formatting__returns_dd_mm(db_session, sample_sa
         assert 1 <= int(month) <= 12
 
 
+def test_iter_sales_summary__date_range__yields_rows_in_date_order(db_session, sample_sales):
+    rows = list(services.iter_sales_summary(db_session, start_date=day_before_yesterday, end_date=yesterday))
+
+    assert [row["date"] for row in rows] == [day_before_yesterday.strftime("%d-%m"), yesterday.strftime("%d-%m")]
+    assert [row["avg_check_size"] for row in rows] == [250.0, 166.67]
+    assert [row["orders"] for row in rows] == [2, 6]
+
+
 @pytest.mark.parametrize("limit, expected_result", [
     (0, ([], [])),
     (2, (["B2", "A1"], [20, 10])),
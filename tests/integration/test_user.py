@@ -1,5 +1,4 @@
 import pytest
-from decimal import Decimal
 
 from infrastructure.db.models.users import User, Order
 from domain import services
@@ -65,13 +64,13 @@ def test_sessions__user_without_orders__returns_zero(db_session, sample_users):
 
 def test_total_amount__user_has_orders__returns_sum_of_final_cost(db_session, sample_orders, sample_users):
     amount = services.get_total_amount(db_session, sample_users["user1"].id)
-    assert isinstance(amount, Decimal)
-    assert amount == Decimal("210")
+    assert isinstance(amount, float)
+    assert amount == 210
 
 
 def test_total_amount__user_without_orders__returns_zero(db_session, sample_users):
     amount = services.get_total_amount(db_session, sample_users["user1"].id)
-    assert amount == Decimal("0")
+    assert amount == 0
 
 
 @pytest.mark.parametrize(
@@ -2,7 +2,7 @@ import pytest
 import io
 from PIL import Image
 
-from utils.images import validate_image, resize_and_save_image, process_image_upload
+from utils.images import validate_image, resize_and_save_image, prepare_image_upload, process_image_upload
 from tests.factories.image import make_image_file, make_upload
 from domain.core.errors import DomainValidationError, ConflictError, DomainError, NotFoundError
 
@@ -109,6 +109,17 @@ def test_process_image_upload__jpeg_extension__converts_to_jpg(tmp_path):
     assert saved.exists()
 
 
+def test_prepare_image_upload__valid_image__returns_stream_and_filename_without_saving(tmp_path):
+    upload = make_upload(filename="photo.jpeg", mimetype="image/jpeg", format="JPEG")
+
+    file_obj, filename = prepare_image_upload(upload)
+
+    assert file_obj is upload.file
+    assert file_obj.tell() == 0
+    assert filename.endswith(".jpg")
+    assert not any(tmp_path.iterdir())
+
+
 def test_process_image_upload__missing_file_object__raises_not_found(tmp_path):
     upload = make_upload()
     # remove the file attribute to simulate missing object
@@ -0,0 +1,34 @@
+import sys
+import pytest
+from datetime import date
+
+from domain import schemas
+from utils.helpers import static_key, date_range_key
+
+namespace = "cache:statistics"
+
+
+def test_static_key__any_arguments__returns_same_key():
+    builder = static_key("cache:menu:detail")
+
+    assert builder() == "cache:menu:detail"
+    assert builder(object(), namespace, kwargs={"db": None}) == "cache:menu:detail"
+
+
+def test_static_key__built_key__returns_interned_string():
+    key = "".join(["cache:", "comments:", "list"])
+    builder = static_key(key)
+
+    assert builder() is sys.intern(key)
+    assert builder() is builder()
+
+
+@pytest.mark.parametrize("start, end, expected", [
+    (date(2025, 4, 1), date(2025, 4, 30), f"{namespace}:2025-04-01:2025-04-30"),
+    (date(2025, 4, 1), date(2025, 4, 1), f"{namespace}:2025-04-01:2025-04-01"),
+])
+def test_date_range_key__query_params__returns_key_per_range(start, end, expected):
+    params = schemas.StatisticsQuerySchema(start_date=start, end_date=end)
+    builder = date_range_key()
+
+    assert builder(object(), namespace, request=None, response=None, args=(), kwargs={"params": params}) == expected
@@ -1,7 +1,21 @@
+import sys
+
+
 def static_key(key: str):
     """Return a key builder function for FastAPI-Cache."""
+    key = sys.intern(key)
 
     def builder(*args, **kwargs):
         return key
 
     return builder
+
+
+def date_range_key(param: str = "params"):
+    """Return a FastAPI-Cache key builder keyed on the endpoint's start/end date query schema."""
+
+    def builder(func, namespace: str = "", *, kwargs, **_):
+        params = kwargs[param]
+        return f"{namespace}:{params.start_date.isoformat()}:{params.end_date.isoformat()}"
+
+    return builder
@@ -54,23 +54,18 @@ def resize_and_save_image(
                 quality=85,
                 optimize=True,
             )
-            logger.info(f"Image_created path={upload_path / filename} user_id={user_id}")
+            logger.info("Image_created path=%s user_id=%s", upload_path / filename, user_id)
 
     except (OSError, ValueError):
         logger.exception("Error_saving_image")
         raise DomainError("Error saving image")
 
 
-def process_image_upload(
+def prepare_image_upload(
         file: BinaryIO,
-        user_id: int,
-        upload_folder: str | None = None,
         allowed_extensions: set[str] | None = None,
-        max_width: int = 1000,
-) -> str:
-    if upload_folder is None:
-        upload_folder = settings.UPLOAD_DIR
-
+) -> tuple[BinaryIO, str]:
+    """Validate an uploaded image and pick its stored filename; pixels are not decoded yet."""
     if allowed_extensions is None:
         allowed_extensions = {"png", "jpg", "jpeg"}
 
@@ -93,7 +88,20 @@ def process_image_upload(
     validate_image(file_obj)
 
     ext = "jpg" if ext == "jpeg" else ext
-    filename = f"{uuid.uuid4().hex}.{ext}"
+    return file_obj, f"{uuid.uuid4().hex}.{ext}"
+
+
+def process_image_upload(
+        file: BinaryIO,
+        user_id: int,
+        upload_folder: str | None = None,
+        allowed_extensions: set[str] | None = None,
+        max_width: int = 1000,
+) -> str:
+    if upload_folder is None:
+        upload_folder = settings.UPLOAD_DIR
+
+    file_obj, filename = prepare_image_upload(file, allowed_extensions)
 
     resize_and_save_image(
         file_obj=file_obj,